@@ -1,12 +1,26 @@
 """
 Audio Backend Integrations
 """
-from audio_backend.integrations.swiftf0_wrapper import SwiftF0Wrapper
-from audio_backend.integrations.svc_wrapper import SVCWrapper
-from audio_backend.integrations.instrumental_wrapper import InstrumentalWrapper
+import importlib
 
 __all__ = [
     "SwiftF0Wrapper",
     "SVCWrapper",
     "InstrumentalWrapper",
 ]
+
+_WRAPPER_MODULES = {
+    "SwiftF0Wrapper": "audio_backend.integrations.swiftf0_wrapper",
+    "SVCWrapper": "audio_backend.integrations.svc_wrapper",
+    "InstrumentalWrapper": "audio_backend.integrations.instrumental_wrapper",
+}
+
+
+def __getattr__(name):
+    # PEP 562: import wrapper submodules only on first attribute access
+    module_name = _WRAPPER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(importlib.import_module(module_name), name)
+    globals()[name] = attr
+    return attr
@@ -0,0 +1,37 @@
+"""
+Shared device and module probing for the integration wrappers
+"""
+import functools
+import importlib.util
+
+
+@functools.lru_cache(maxsize=None)
+def has_module(name: str) -> bool:
+    """
+    Check if a module is importable without actually importing it
+
+    Args:
+        name: Module name to probe
+
+    Returns:
+        True if the module can be imported
+    """
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def cuda_available() -> bool:
+    """
+    Check if CUDA is available, probing the driver at most once per process
+
+    Returns:
+        True if torch is installed and CUDA is available
+    """
+    try:
+        import torch
+        return torch.cuda.is_available()
+    except ImportError:
+        return False
@@ -0,0 +1,30 @@
+"""
+Numba-accelerated stem mixing for the instrumental wrapper
+Parallel reduction kernel used when three or more stems are summed
+"""
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def mix_stems_into(stems, out: np.ndarray):
+    """
+    Sum a list of (T, C) float32 stem arrays into a preallocated output
+
+    Frames are distributed across cores via prange; the inner stem loop
+    vectorises to FMA instructions, so the reduction runs at aggregate
+    DRAM bandwidth instead of a single core's share.
+
+    Args:
+        stems: Typed list of contiguous (T, C) float32 arrays
+        out: Preallocated (T, C) float32 output array
+    """
+    n_frames, n_channels = out.shape
+    n_stems = len(stems)
+
+    for t in prange(n_frames):
+        for c in range(n_channels):
+            acc = np.float32(0.0)
+            for k in range(n_stems):
+                acc += stems[k][t, c]
+            out[t, c] = acc
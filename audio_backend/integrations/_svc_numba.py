@@ -0,0 +1,119 @@
+"""
+Numba-accelerated pitch shift for the SVC placeholder path
+JIT-compiled phase vocoder and resampler used when no SVC backend is installed
+"""
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def _phase_vocoder(stft_matrix: np.ndarray, rate: float, hop_length: int) -> np.ndarray:
+    """
+    Time-stretch an STFT matrix by the given rate via phase accumulation
+
+    Args:
+        stft_matrix: Complex STFT matrix of shape (n_bins, n_frames)
+        rate: Stretch factor (>1 speeds up, <1 slows down)
+        hop_length: STFT hop length in samples
+
+    Returns:
+        Time-stretched complex STFT matrix
+    """
+    n_bins, n_frames = stft_matrix.shape
+    n_out = int(np.ceil(n_frames / rate))
+    out = np.zeros((n_bins, n_out), dtype=np.complex64)
+    two_pi = 2.0 * np.pi
+
+    # Each bin accumulates phase independently, so bins parallelise cleanly
+    for b in prange(n_bins):
+        phi_advance = np.pi * hop_length * b / (n_bins - 1)
+        phase = np.angle(stft_matrix[b, 0])
+
+        for i in range(n_out):
+            t = i * rate
+            k = int(t)
+            alpha = t - k
+
+            c0 = stft_matrix[b, k]
+            c1 = stft_matrix[b, k + 1] if k + 1 < n_frames else 0.0 + 0.0j
+
+            # Linear magnitude interpolation, accumulated phase
+            mag = (1.0 - alpha) * abs(c0) + alpha * abs(c1)
+            out[b, i] = mag * np.exp(1j * phase)
+
+            # Wrap the phase deviation to [-pi, pi] and advance
+            dphase = np.angle(c1) - np.angle(c0) - phi_advance
+            dphase -= two_pi * np.round(dphase / two_pi)
+            phase += phi_advance + dphase
+
+    return out
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def _resample_linear(y: np.ndarray, orig_sr: float, target_sr: float) -> np.ndarray:
+    """
+    Linearly resample a mono waveform between sample rates
+
+    Args:
+        y: Input waveform (float32)
+        orig_sr: Original sample rate
+        target_sr: Target sample rate
+
+    Returns:
+        Resampled waveform (float32)
+    """
+    n_in = len(y)
+    n_out = int(round(n_in * target_sr / orig_sr))
+    out = np.empty(n_out, dtype=np.float32)
+    ratio = orig_sr / target_sr
+
+    for i in prange(n_out):
+        t = i * ratio
+        k = int(t)
+        if k + 1 < n_in:
+            frac = t - k
+            out[i] = (1.0 - frac) * y[k] + frac * y[k + 1]
+        else:
+            out[i] = y[n_in - 1]
+
+    return out
+
+
+def pitch_shift(
+    y: np.ndarray,
+    sr: int,
+    n_steps: int,
+    n_fft: int = 2048,
+    hop_length: int = 512
+) -> np.ndarray:
+    """
+    Pitch-shift a mono waveform by n_steps semitones
+
+    Runs librosa's STFT/ISTFT (already C-backed) around the jitted
+    phase-vocoder and resampler kernels, bypassing the pure-Python
+    phase vocoder inside librosa.effects.pitch_shift.
+
+    Args:
+        y: Input mono waveform
+        sr: Sample rate
+        n_steps: Pitch shift in semitones
+        n_fft: FFT window size
+        hop_length: STFT hop length
+
+    Returns:
+        Pitch-shifted waveform with the same length as the input
+    """
+    import librosa
+
+    rate = 2.0 ** (-float(n_steps) / 12.0)
+
+    stft_matrix = librosa.stft(y, n_fft=n_fft, hop_length=hop_length).astype(np.complex64)
+    stretched = _phase_vocoder(stft_matrix, rate, hop_length)
+    y_stretched = librosa.istft(stretched, hop_length=hop_length).astype(np.float32)
+
+    y_shifted = _resample_linear(y_stretched, float(sr) / rate, float(sr))
+
+    # Match the input length
+    if len(y_shifted) >= len(y):
+        return y_shifted[:len(y)]
+    return np.pad(y_shifted, (0, len(y) - len(y_shifted)))
@@ -2,14 +2,33 @@
 Instrumental Generation Wrapper
 Placeholder wrapper for HeartMuLa and ACE-Step instrumental generation
 """
+import functools
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-import numpy as np
-import soundfile as sf
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_STEMS = ("vocals", "drums", "bass", "other")
+DEFAULT_INSTRUMENTAL_STEMS = ("drums", "bass", "other")
+
+
+@functools.lru_cache(maxsize=1)
+def _check_available_models() -> Dict[str, bool]:
+    """Probe instrumental backends once per process (result is shared)"""
+    from audio_backend.integrations._device import has_module
+
+    models = {
+        "heartmula": has_module("heartmula"),
+        "ace-step": has_module("ace_step")
+    }
+
+    logger.info(f"Available instrumental models: {models}")
+    return models
+
 
 class InstrumentalWrapper:
     """Wrapper for instrumental generation models (HeartMuLa, ACE-Step)"""
@@ -20,32 +39,15 @@ class InstrumentalWrapper:
         self.model_path = None
         self.loaded = False
         self.available_models = self._check_available_models()
-    
+        self.available = any(self.available_models.values())
+
     def _check_available_models(self) -> Dict[str, bool]:
-        """Check which instrumental models are available"""
-        models = {
-            "heartmula": False,
-            "ace-step": False
-        }
-        
-        try:
-            import heartmula
-            models["heartmula"] = True
-        except ImportError:
-            pass
-        
-        try:
-            import ace_step
-            models["ace-step"] = True
-        except ImportError:
-            pass
-        
-        logger.info(f"Available instrumental models: {models}")
-        return models
+        """Check which instrumental models are available (cached per process)"""
+        return _check_available_models()
     
     def is_available(self) -> bool:
         """Check if any instrumental model is available"""
-        return any(self.available_models.values())
+        return self.available
     
     def is_loaded(self) -> bool:
         """Check if model is loaded"""
@@ -113,12 +115,9 @@ class InstrumentalWrapper:
         logger.info(f"ACE-Step model loaded from {model_path}")
     
     def _cuda_available(self) -> bool:
-        """Check if CUDA is available"""
-        try:
-            import torch
-            return torch.cuda.is_available()
-        except ImportError:
-            return False
+        """Check if CUDA is available (probed once per process)"""
+        from audio_backend.integrations._device import cuda_available
+        return cuda_available()
     
     def process(
         self,
@@ -126,7 +125,7 @@ class InstrumentalWrapper:
         output_path: str,
         split_vocals: bool = True,
         stem_separation: bool = False,
-        stems: List[str] = ["vocals", "drums", "bass", "other"],
+        stems: Optional[Tuple[str, ...]] = None,
         keep_reverb: bool = False,
         generate_instrumental: bool = True
     ) -> bool:
@@ -145,8 +144,9 @@ class InstrumentalWrapper:
         Returns:
             True if processed successfully, False otherwise
         """
+        stems = stems or DEFAULT_STEMS
         try:
-            if not self.available or self.model is None:
+            if self.model is None:
                 # Placeholder processing
                 return self._placeholder_process(
                     input_path,
@@ -188,6 +188,114 @@ class InstrumentalWrapper:
                 stems
             )
     
+    def _mix_stems(self, result: Dict[str, Any], stem_names: List[str]) -> "np.ndarray":
+        """
+        Sum stem arrays into a single instrumental track without building
+        an (N_stems, T, C) temporary the way np.sum over a list would
+
+        The accumulation buffer is allocated per call: the wrapper is a
+        shared singleton and concurrent segments would otherwise mix into
+        the same array.
+
+        Args:
+            result: Separation result mapping stem names to arrays
+            stem_names: Names of stems to accumulate
+
+        Returns:
+            Accumulated instrumental audio array
+        """
+        import numpy as np
+
+        first, *rest = stem_names
+        first_audio = np.asarray(result[first], dtype=np.float32)
+        buffer = np.empty_like(first_audio)
+
+        # With 3+ stems the reduction is DRAM-bound on one core; hand it
+        # to the parallel numba kernel when numba is installed
+        if len(stem_names) > 2 and self._mix_stems_parallel(result, stem_names, buffer):
+            return buffer
+
+        np.copyto(buffer, first_audio)
+        for stem in rest:
+            np.add(buffer, result[stem], out=buffer)
+        return buffer
+
+    @staticmethod
+    def _mix_stems_parallel(
+        result: Dict[str, Any],
+        stem_names: List[str],
+        buffer: "np.ndarray"
+    ) -> bool:
+        """
+        Try the parallel numba stem-mix kernel
+
+        Args:
+            result: Separation result mapping stem names to arrays
+            stem_names: Names of stems to accumulate
+            buffer: Preallocated output buffer matching the stem shape
+
+        Returns:
+            True if the kernel ran, False to fall back to the numpy path
+        """
+        try:
+            from numba.typed import List as NumbaList
+            from audio_backend.integrations._mix_numba import mix_stems_into
+        except ImportError:
+            return False
+
+        import numpy as np
+
+        # Normalise every stem to a contiguous (T, C) float32 view
+        out_2d = buffer.reshape(buffer.shape[0], -1)
+        stems = NumbaList()
+        for stem in stem_names:
+            arr = np.ascontiguousarray(np.asarray(result[stem], dtype=np.float32))
+            arr = arr.reshape(arr.shape[0], -1)
+            if arr.shape != out_2d.shape:
+                return False
+            stems.append(arr)
+
+        mix_stems_into(stems, out_2d)
+        return True
+
+    def _instrumental_from_result(
+        self,
+        result: Dict[str, Any],
+        input_path: str
+    ) -> Optional["np.ndarray"]:
+        """
+        Get the instrumental track from a separation result
+
+        When the backend only returned vocals (its primary head), derive
+        the instrumental as original - vocals with one in-place subtract
+        instead of re-running the model's instrumental head.
+
+        Args:
+            result: Separation result dictionary
+            input_path: Original input audio path
+
+        Returns:
+            Instrumental audio array, or None if it cannot be derived
+        """
+        if "instrumental" in result:
+            return result["instrumental"]
+        if "vocals" not in result:
+            return None
+
+        import numpy as np
+        import soundfile as sf
+
+        original, sr = sf.read(input_path, dtype='float32')
+        if sr != result["sample_rate"]:
+            return None
+
+        vocals = np.asarray(result["vocals"], dtype=np.float32)
+        if vocals.shape != original.shape:
+            return None
+
+        np.subtract(original, vocals, out=original)
+        return original
+
     def _process_heartmula(
         self,
         input_path: str,
@@ -197,6 +305,8 @@ class InstrumentalWrapper:
         stems: List[str]
     ):
         """Process with HeartMuLa"""
+        import soundfile as sf
+
         if stem_separation:
             # Multi-stem separation
             result = self.model.separate_stems(
@@ -205,10 +315,13 @@ class InstrumentalWrapper:
                 keep_reverb=self.model.config.get("keep_reverb", False)
             )
             
-            # Combine instrumental stems
-            instrumental_stems = [s for s in stems if s != "vocals"]
-            instrumental_audio = np.sum([result[s] for s in instrumental_stems], axis=0)
-            
+            # Combine instrumental stems in-place (no stacked temporary)
+            if stems is DEFAULT_STEMS:
+                instrumental_stems = DEFAULT_INSTRUMENTAL_STEMS
+            else:
+                instrumental_stems = [s for s in stems if s != "vocals"]
+            instrumental_audio = self._mix_stems(result, instrumental_stems)
+
             sf.write(output_path, instrumental_audio, result["sample_rate"])
         else:
             # Simple vocal/instrumental separation
@@ -217,8 +330,11 @@ class InstrumentalWrapper:
                 split_vocals=split_vocals,
                 keep_reverb=self.model.config.get("keep_reverb", False)
             )
-            
-            sf.write(output_path, result["instrumental"], result["sample_rate"])
+
+            instrumental = self._instrumental_from_result(result, input_path)
+            if instrumental is None:
+                instrumental = result["instrumental"]
+            sf.write(output_path, instrumental, result["sample_rate"])
     
     def _process_ace_step(
         self,
@@ -229,6 +345,8 @@ class InstrumentalWrapper:
         stems: List[str]
     ):
         """Process with ACE-Step"""
+        import soundfile as sf
+
         if stem_separation:
             # Multi-stem separation
             result = self.model.separate(
@@ -236,10 +354,13 @@ class InstrumentalWrapper:
                 stems=stems
             )
             
-            # Combine instrumental stems
-            instrumental_stems = [s for s in stems if s != "vocals"]
-            instrumental_audio = np.sum([result[s] for s in instrumental_stems], axis=0)
-            
+            # Combine instrumental stems in-place (no stacked temporary)
+            if stems is DEFAULT_STEMS:
+                instrumental_stems = DEFAULT_INSTRUMENTAL_STEMS
+            else:
+                instrumental_stems = [s for s in stems if s != "vocals"]
+            instrumental_audio = self._mix_stems(result, instrumental_stems)
+
             sf.write(output_path, instrumental_audio, result["sample_rate"])
         else:
             # Simple vocal/instrumental separation
@@ -247,9 +368,10 @@ class InstrumentalWrapper:
                 input_path=input_path,
                 output_type="instrumental" if not split_vocals else "both"
             )
-            
-            if "instrumental" in result:
-                sf.write(output_path, result["instrumental"], result["sample_rate"])
+
+            instrumental = self._instrumental_from_result(result, input_path)
+            if instrumental is not None:
+                sf.write(output_path, instrumental, result["sample_rate"])
             else:
                 # Fallback to original if separation fails
                 import shutil
@@ -286,13 +408,15 @@ class InstrumentalWrapper:
             logger.info(f"Placeholder: copied audio to {output_path}")
             
             if stem_separation:
-                # Create placeholder stem files
-                output_dir = Path(output_path).parent
+                # Create placeholder stem files (paths built as plain
+                # strings, no PurePath construction inside the loop)
+                import os
+                output_dir = os.path.dirname(output_path)
                 base_name = Path(output_path).stem
-                
+
                 for stem in stems:
-                    stem_path = output_dir / f"{base_name}_{stem}.wav"
-                    shutil.copy(input_path, stem_path)
+                    stem_path = os.path.join(output_dir, f"{base_name}_{stem}.wav")
+                    self._clone_file(input_path, stem_path)
                     logger.info(f"Placeholder: created stem {stem} at {stem_path}")
             
             return True
@@ -301,6 +425,53 @@ class InstrumentalWrapper:
             logger.error(f"Placeholder instrumental processing failed: {e}")
             return False
     
+    @staticmethod
+    def _clone_file(src: str, dst):
+        """
+        Hardlink a file when possible, falling back to a regular copy
+
+        The placeholder fan-out writes byte-identical files, so a hardlink
+        (one inode update) replaces a full data copy per stem.
+
+        Args:
+            src: Source file path
+            dst: Destination file path
+        """
+        import os
+        import shutil
+
+        try:
+            if os.path.exists(dst):
+                os.unlink(dst)
+            os.link(src, dst)
+        except OSError:
+            # Cross-device link, unsupported filesystem, or Windows
+            shutil.copy(src, dst)
+
+    @staticmethod
+    def _write_stem(stem_path: str, data: "np.ndarray", sample_rate: int):
+        """
+        Write one stem through a streaming SoundFile writer
+
+        Args:
+            stem_path: Output file path
+            data: Stem audio array
+            sample_rate: Sample rate in Hz
+        """
+        import numpy as np
+        import soundfile as sf
+
+        data = np.ascontiguousarray(data)
+        channels = 1 if data.ndim == 1 else data.shape[1]
+        with sf.SoundFile(
+            str(stem_path),
+            mode='w',
+            samplerate=sample_rate,
+            channels=channels,
+            subtype='PCM_16'
+        ) as f:
+            f.write(data)
+
     def generate(
         self,
         prompt: str,
@@ -324,7 +495,9 @@ class InstrumentalWrapper:
             if not self.available or self.model is None:
                 logger.warning("Instrumental generation not available in placeholder mode")
                 return False
-            
+
+            import soundfile as sf
+
             # Generate instrumental
             result = self.model.generate(
                 prompt=prompt,
@@ -344,7 +517,7 @@ class InstrumentalWrapper:
         self,
         input_path: str,
         output_dir: str,
-        stems: List[str] = ["vocals", "drums", "bass", "other"]
+        stems: Optional[Tuple[str, ...]] = None
     ) -> Dict[str, str]:
         """
         Separate audio into stems
@@ -357,33 +530,47 @@ class InstrumentalWrapper:
         Returns:
             Dictionary mapping stem names to output paths
         """
+        stems = stems or DEFAULT_STEMS
         try:
+            import os
+
+            base_name = Path(input_path).stem
+
             if not self.available or self.model is None:
-                # Placeholder: copy input to all stem files
-                import shutil
-                output_dir_path = Path(output_dir)
-                output_dir_path.mkdir(exist_ok=True, parents=True)
-                
+                # Placeholder: fan the input out to all stem files
+                Path(output_dir).mkdir(exist_ok=True, parents=True)
+
                 stem_outputs = {}
                 for stem in stems:
-                    stem_path = output_dir_path / f"{Path(input_path).stem}_{stem}.wav"
-                    shutil.copy(input_path, stem_path)
-                    stem_outputs[stem] = str(stem_path)
-                
+                    stem_path = os.path.join(output_dir, f"{base_name}_{stem}.wav")
+                    self._clone_file(input_path, stem_path)
+                    stem_outputs[stem] = stem_path
+
                 return stem_outputs
-            
+
             # Actual stem separation
             result = self.model.separate(
                 input_path=input_path,
                 stems=stems
             )
-            
+
+            # Stream writes and run them in parallel: libsndfile releases
+            # the GIL, so concurrent stem writes overlap on the I/O side
+            from concurrent.futures import ThreadPoolExecutor
+
+            sample_rate = result["sample_rate"]
             stem_outputs = {}
-            for stem in stems:
-                stem_path = Path(output_dir) / f"{Path(input_path).stem}_{stem}.wav"
-                sf.write(stem_path, result[stem], result["sample_rate"])
-                stem_outputs[stem] = str(stem_path)
-            
+            with ThreadPoolExecutor(max_workers=min(len(stems), 4)) as pool:
+                futures = []
+                for stem in stems:
+                    stem_path = os.path.join(output_dir, f"{base_name}_{stem}.wav")
+                    futures.append(pool.submit(
+                        self._write_stem, stem_path, result[stem], sample_rate
+                    ))
+                    stem_outputs[stem] = stem_path
+                for future in futures:
+                    future.result()
+
             return stem_outputs
             
         except Exception as e:
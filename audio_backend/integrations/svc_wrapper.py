@@ -2,15 +2,69 @@
 SVC (Singing Voice Conversion) Wrapper
 Placeholder wrapper for so-vits-svc, HQ-SVC, and Echo
 """
+import functools
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-import numpy as np
-import soundfile as sf
+from typing import Optional, Dict, Any, List, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _check_available_variants() -> Dict[str, bool]:
+    """Probe SVC backends once per process (result is shared)"""
+    from audio_backend.integrations._device import has_module
+
+    variants = {
+        "so-vits-svc": has_module("so_vits_svc"),
+        "hq-svc": has_module("hq_svc"),
+        "echo": has_module("echo_svc")
+    }
+
+    logger.info(f"Available SVC variants: {variants}")
+    return variants
+
+
+@functools.lru_cache(maxsize=32)
+def _pitch_ratio(n_steps: int) -> Tuple[int, int]:
+    """
+    Rational approximation of the 2**(-n_steps/12) resampling ratio
+
+    Args:
+        n_steps: Pitch shift in semitones
+
+    Returns:
+        (up, down) integer resampling factors
+    """
+    from fractions import Fraction
+
+    frac = Fraction(2.0 ** (-n_steps / 12.0)).limit_denominator(1000)
+    return frac.numerator, frac.denominator
+
+
+@functools.lru_cache(maxsize=32)
+def _get_pitch_filter(n_steps: int):
+    """
+    Precompute the Kaiser polyphase filter for an integer semitone shift
+
+    transpose only takes a handful of integer values in practice, so the
+    filter design (the expensive part of resample_poly) is done once per
+    value and cached for the life of the process.
+
+    Args:
+        n_steps: Pitch shift in semitones
+
+    Returns:
+        FIR filter coefficients for scipy.signal.resample_poly
+    """
+    from scipy import signal
+
+    up, down = _pitch_ratio(n_steps)
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    return signal.firwin(2 * half_len + 1, 1.0 / max_rate, window=('kaiser', 5.0))
+
+
 class SVCWrapper:
     """Wrapper for SVC models (so-vits-svc, HQ-SVC, Echo)"""
     
@@ -20,39 +74,15 @@ class SVCWrapper:
         self.model_path = None
         self.loaded = False
         self.available_variants = self._check_available_variants()
-    
+        self.available = any(self.available_variants.values())
+
     def _check_available_variants(self) -> Dict[str, bool]:
-        """Check which SVC variants are available"""
-        variants = {
-            "so-vits-svc": False,
-            "hq-svc": False,
-            "echo": False
-        }
-        
-        try:
-            import so_vits_svc
-            variants["so-vits-svc"] = True
-        except ImportError:
-            pass
-        
-        try:
-            import hq_svc
-            variants["hq-svc"] = True
-        except ImportError:
-            pass
-        
-        try:
-            import echo_svc
-            variants["echo"] = True
-        except ImportError:
-            pass
-        
-        logger.info(f"Available SVC variants: {variants}")
-        return variants
+        """Check which SVC variants are available (cached per process)"""
+        return _check_available_variants()
     
     def is_available(self) -> bool:
         """Check if any SVC variant is available"""
-        return any(self.available_variants.values())
+        return self.available
     
     def is_loaded(self) -> bool:
         """Check if model is loaded"""
@@ -173,7 +203,7 @@ class SVCWrapper:
             True if processed successfully, False otherwise
         """
         try:
-            if not self.available or self.model is None:
+            if self.model is None:
                 # Placeholder processing
                 return self._placeholder_process(
                     input_path,
@@ -236,33 +266,41 @@ class SVCWrapper:
             True if processed successfully
         """
         try:
-            import librosa
-            
-            # Load audio
-            audio, sr = sf.read(input_path)
-            
             if transpose == 0:
-                # No change, just copy
-                sf.write(output_path, audio, sr)
+                # No change: byte-level copy, skip the decode/encode cycle
+                import shutil
+                shutil.copy(input_path, output_path)
                 logger.info(f"Placeholder: copied audio to {output_path}")
                 return True
-            
+
+            import librosa
+            import numpy as np
+            import soundfile as sf
+
+            # Load audio as float32: the float64 default doubles memory
+            # traffic through the phase vocoder for no audible benefit
+            audio, sr = sf.read(input_path, dtype='float32')
+
             # Apply transpose using librosa
             if len(audio.shape) == 1:
                 audio_mono = audio
             else:
                 audio_mono = audio[:, 0]
             
-            # Pitch shift
-            y_shifted = librosa.effects.pitch_shift(
-                audio_mono,
-                sr=sr,
-                n_steps=transpose
-            )
+            # Pitch shift (numba-jitted phase vocoder when numba is installed)
+            try:
+                from audio_backend.integrations._svc_numba import pitch_shift
+                y_shifted = pitch_shift(audio_mono, sr, transpose)
+            except ImportError:
+                y_shifted = self._scipy_pitch_shift(audio_mono, sr, transpose)
             
-            # Handle stereo
+            # Handle stereo: zero-copy broadcast view, soundfile accepts
+            # non-contiguous arrays so no duplication is needed
             if len(audio.shape) > 1:
-                processed_audio = np.column_stack([y_shifted] * audio.shape[1])
+                processed_audio = np.broadcast_to(
+                    y_shifted[:, None],
+                    (y_shifted.shape[0], audio.shape[1])
+                )
             else:
                 processed_audio = y_shifted
             
@@ -274,6 +312,43 @@ class SVCWrapper:
             logger.error(f"Placeholder SVC processing failed: {e}")
             return False
     
+    @staticmethod
+    def _scipy_pitch_shift(audio_mono, sr: int, n_steps: int):
+        """
+        Pitch-shift via phase vocoder plus a cached polyphase resampler
+
+        librosa.effects.pitch_shift redesigns its resampling filter on
+        every call; here the filter for each integer semitone value is
+        precomputed once and reused via _get_pitch_filter.
+
+        Args:
+            audio_mono: Mono waveform
+            sr: Sample rate
+            n_steps: Pitch shift in semitones
+
+        Returns:
+            Pitch-shifted waveform with the input length
+        """
+        import librosa
+        import numpy as np
+
+        try:
+            from scipy.signal import resample_poly
+        except ImportError:
+            return librosa.effects.pitch_shift(audio_mono, sr=sr, n_steps=n_steps)
+
+        rate = 2.0 ** (-n_steps / 12.0)
+        stft_matrix = librosa.stft(audio_mono)
+        stretched = librosa.phase_vocoder(stft_matrix, rate=rate)
+        y_stretched = librosa.istft(stretched)
+
+        up, down = _pitch_ratio(n_steps)
+        y_shifted = resample_poly(y_stretched, up, down, window=_get_pitch_filter(n_steps))
+
+        if len(y_shifted) >= len(audio_mono):
+            return y_shifted[:len(audio_mono)]
+        return np.pad(y_shifted, (0, len(audio_mono) - len(y_shifted)))
+
     def get_speakers(self) -> List[str]:
         """
         Get available speakers from loaded model
@@ -2,6 +2,7 @@
 SwiftF0 Wrapper
 Placeholder wrapper for SwiftF0 pitch extraction and manipulation
 """
+import functools
 import logging
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -10,6 +11,74 @@ import soundfile as sf
 
 logger = logging.getLogger(__name__)
 
+# Memoized librosa handle: the per-call import statements still cost a
+# sys.modules lookup plus attribute resolution under the GIL on every
+# segment; after the first call this is a plain global read
+_librosa = None
+
+
+def _get_librosa():
+    """Import librosa once and reuse the module object"""
+    global _librosa
+    if _librosa is None:
+        import librosa
+        _librosa = librosa
+    return _librosa
+
+
+# Vocal-band pyin defaults, precomputed so no per-call note_to_hz string
+# parsing (or librosa lazy-loader attribute access) is needed. 65 Hz is
+# note_to_hz('C2'); the old C7 ceiling (~2093 Hz) was far above any vocal F0.
+_F0_MIN_HZ = 65.0
+_F0_MAX_HZ = 600.0
+
+
+def _as_mono_f32(audio: np.ndarray) -> np.ndarray:
+    """
+    Collapse audio to a contiguous float32 mono array
+
+    Multichannel input is averaged down in a single float32 pass (better
+    F0 SNR on stereo vocals than picking one channel); already-mono
+    float32 input is returned as-is, so the common case costs nothing.
+    Handing librosa a strided or float64 array makes it copy internally.
+
+    Args:
+        audio: Audio array, (n,) or (n, channels)
+
+    Returns:
+        Contiguous float32 mono array
+    """
+    if audio.ndim == 2:
+        if audio.shape[1] > 1:
+            audio = audio.mean(axis=1, dtype=np.float32)
+        else:
+            audio = audio[:, 0]
+    return np.ascontiguousarray(audio, dtype=np.float32)
+
+
+@functools.lru_cache(maxsize=1)
+def _pyin_fast_viterbi_kwargs() -> Dict[str, str]:
+    """
+    Extra librosa.pyin kwargs enabling the sparse Viterbi backend
+
+    The dense Viterbi decode dominates pyin runtime; newer librosa
+    releases expose an O(K)-per-frame sparse implementation behind the
+    viterbi_impl parameter. Probe the signature once per process.
+
+    Returns:
+        {"viterbi_impl": "fast"} when supported, otherwise {}
+    """
+    import inspect
+
+    librosa = _get_librosa()
+
+    try:
+        if "viterbi_impl" in inspect.signature(librosa.pyin).parameters:
+            return {"viterbi_impl": "fast"}
+    except (TypeError, ValueError):
+        pass
+    return {}
+
 
 class SwiftF0Wrapper:
     """Wrapper for SwiftF0 pitch extraction and manipulation"""
@@ -19,16 +88,19 @@ class SwiftF0Wrapper:
         self.model = None
         self.loaded = False
         self.available = self._check_availability()
+        self._f0_cache_dir = Path("./audio_temp") / "f0_cache"
+        # Full-file F0 contours memoized in-process so per-segment
+        # lookups slice one pyin run instead of re-running it
+        self._f0_memo: Dict[Any, Any] = {}
     
     def _check_availability(self) -> bool:
-        """Check if SwiftF0 is available"""
-        try:
-            # Try to import SwiftF0
-            import swiftf0
+        """Check if SwiftF0 is available (spec probe only, no import)"""
+        from audio_backend.integrations._device import has_module
+
+        if has_module("swiftf0"):
             return True
-        except ImportError:
-            logger.warning("SwiftF0 not installed, using placeholder")
-            return False
+        logger.warning("SwiftF0 not installed, using placeholder")
+        return False
     
     def is_available(self) -> bool:
         """Check if SwiftF0 wrapper is available"""
@@ -97,10 +169,18 @@ class SwiftF0Wrapper:
         Returns:
             True if processed successfully, False otherwise
         """
+        # Load audio once, as float32 (the float64 default doubles memory
+        # traffic for no analysis benefit); the fallback path below reuses
+        # the decoded arrays instead of paying a second decode
+        try:
+            with sf.SoundFile(input_path) as f:
+                sr = f.samplerate
+                audio = f.read(dtype='float32', always_2d=False)
+        except Exception as e:
+            logger.error(f"SwiftF0 processing failed: {e}")
+            return False
+
         try:
-            # Load audio
-            audio, sr = sf.read(input_path)
-            
             if not self.available or self.model is None:
                 # Placeholder: simple pitch shift using librosa
                 return self._placeholder_process(
@@ -133,9 +213,8 @@ class SwiftF0Wrapper:
                 
         except Exception as e:
             logger.error(f"SwiftF0 processing failed: {e}")
-            # Fall back to placeholder
+            # Fall back to placeholder with the already-decoded audio
             try:
-                audio, sr = sf.read(input_path)
                 return self._placeholder_process(
                     audio, sr, output_path, pitch_shift, formant_shift
                 )
@@ -164,8 +243,8 @@ class SwiftF0Wrapper:
             True if processed successfully
         """
         try:
-            import librosa
-            
+            librosa = _get_librosa()
+
             if pitch_shift == 0 and formant_shift == 1.0:
                 # No change, just copy
                 sf.write(output_path, audio, sr)
@@ -173,29 +252,52 @@ class SwiftF0Wrapper:
                 return True
             
             # Apply pitch shift using librosa (placeholder)
-            if len(audio.shape) == 1:
-                audio_mono = audio
-            else:
-                audio_mono = audio[:, 0]
-            
-            # Pitch shift in semitones
+            audio_mono = _as_mono_f32(audio)
+
+            # Pitch shift in semitones; Rubber Band's C++ phase vocoder
+            # is several times faster than librosa's Python one
             n_steps = pitch_shift
             if n_steps != 0:
-                y_shifted = librosa.effects.pitch_shift(
-                    audio_mono,
-                    sr=sr,
-                    n_steps=n_steps
-                )
+                from audio_backend.integrations._device import has_module
+
+                if has_module("pyrubberband"):
+                    import pyrubberband
+                    y_shifted = pyrubberband.pitch_shift(audio_mono, sr, n_steps)
+                else:
+                    y_shifted = librosa.effects.pitch_shift(
+                        audio_mono,
+                        sr=sr,
+                        n_steps=n_steps
+                    )
             else:
                 y_shifted = audio_mono
             
-            # Handle stereo
+            # Quantise to PCM16 once on the mono signal so the stereo
+            # duplication below stays a zero-copy broadcast view
+            pcm = np.clip(y_shifted * 32767.0, -32768, 32767).astype(np.int16)
+
             if len(audio.shape) > 1:
-                processed_audio = np.column_stack([y_shifted] * audio.shape[1])
+                pcm = np.broadcast_to(
+                    pcm[:, None],
+                    (len(pcm), audio.shape[1])
+                )
+                channels = audio.shape[1]
             else:
-                processed_audio = y_shifted
-            
-            sf.write(output_path, processed_audio, sr)
+                channels = 1
+
+            # Blockwise writes keep peak memory flat and batch libsndfile
+            # syscalls instead of handing it one giant float buffer
+            block = 1 << 16
+            with sf.SoundFile(
+                output_path,
+                mode='w',
+                samplerate=sr,
+                channels=channels,
+                subtype='PCM_16'
+            ) as f:
+                for start in range(0, len(pcm), block):
+                    f.write(pcm[start:start + block])
+
             logger.info(f"Placeholder: audio processed to {output_path}")
             return True
             
@@ -203,37 +305,149 @@ class SwiftF0Wrapper:
             logger.error(f"Placeholder processing failed: {e}")
             return False
     
-    def extract_f0(self, audio_path: str) -> Optional[np.ndarray]:
+    def extract_f0(
+        self,
+        audio_path: str,
+        fmin_hz: float = _F0_MIN_HZ,
+        fmax_hz: float = _F0_MAX_HZ
+    ) -> Optional[np.ndarray]:
         """
         Extract F0 contour from audio
-        
+
         Args:
             audio_path: Input audio file path
-            
+            fmin_hz: Minimum F0 hypothesis in Hz (default covers vocals;
+                the old C2-C7 range wasted pyin states up to ~2 kHz)
+            fmax_hz: Maximum F0 hypothesis in Hz
+
         Returns:
             F0 contour array or None
         """
         try:
-            audio, sr = sf.read(audio_path)
-            
-            if len(audio.shape) > 1:
-                audio_mono = audio[:, 0]
-            else:
-                audio_mono = audio
-            
+            # Re-uploads and segment re-previews hit the same bytes, so
+            # the contour is cached on disk keyed by content hash
+            cache_path = self._f0_cache_path(audio_path, fmin_hz, fmax_hz)
+            if cache_path is not None and cache_path.exists():
+                return np.load(cache_path, allow_pickle=False)
+
+            with sf.SoundFile(audio_path) as f:
+                sr = f.samplerate
+                audio = f.read(dtype='float32', always_2d=False)
+
+            audio_mono = _as_mono_f32(audio)
+
             if self.available and self.model:
-                return self.model.extract_f0(audio_mono, sr)
+                f0 = self.model.extract_f0(audio_mono, sr)
             else:
                 # Placeholder: simple pitch tracking using librosa
-                import librosa
+                librosa = _get_librosa()
+
+                # Analysis-only downsample: vocal F0 below fmax_hz needs
+                # nothing above 16 kHz, and pyin cost scales with sr
+                if sr > 16000:
+                    audio_mono = librosa.resample(
+                        audio_mono,
+                        orig_sr=sr,
+                        target_sr=16000,
+                        res_type="soxr_hq"
+                    )
+                    sr = 16000
+
                 f0, voiced_flag, voiced_probs = librosa.pyin(
                     audio_mono,
-                    fmin=librosa.note_to_hz('C2'),
-                    fmax=librosa.note_to_hz('C7'),
-                    sr=sr
+                    fmin=fmin_hz,
+                    fmax=fmax_hz,
+                    sr=sr,
+                    **_pyin_fast_viterbi_kwargs()
                 )
-                return f0
-                
+
+            if cache_path is not None and f0 is not None:
+                np.save(cache_path, f0, allow_pickle=False)
+            return f0
+
         except Exception as e:
             logger.error(f"F0 extraction failed: {e}")
             return None
+
+    def extract_f0_segment(
+        self,
+        audio_path: str,
+        start_time: float,
+        end_time: float,
+        fmin_hz: float = _F0_MIN_HZ,
+        fmax_hz: float = _F0_MAX_HZ
+    ) -> Optional[np.ndarray]:
+        """
+        Get the F0 contour for one time slice of a file
+
+        pyin pays its HMM transition-matrix build (and numba warm-up)
+        per invocation, so running it per segment multiplies that cost
+        by the segment count. The full-file contour is extracted once,
+        memoized in-process, and sliced by segment boundaries here.
+
+        Args:
+            audio_path: Input audio file path (the full file)
+            start_time: Segment start in seconds
+            end_time: Segment end in seconds
+            fmin_hz: Minimum F0 hypothesis in Hz
+            fmax_hz: Maximum F0 hypothesis in Hz
+
+        Returns:
+            F0 contour slice for the segment, or None
+        """
+        key = (audio_path, fmin_hz, fmax_hz)
+        cached = self._f0_memo.get(key)
+
+        if cached is None:
+            f0 = self.extract_f0(audio_path, fmin_hz, fmax_hz)
+            if f0 is None:
+                return None
+            try:
+                duration = sf.info(audio_path).duration
+            except Exception as e:
+                logger.error(f"F0 segment slicing failed: {e}")
+                return f0
+            # Frames per second maps wall time to contour indices
+            # regardless of the analysis sample rate used internally
+            fps = len(f0) / duration if duration > 0 else 0.0
+            if len(self._f0_memo) >= 8:
+                self._f0_memo.pop(next(iter(self._f0_memo)))
+            cached = self._f0_memo[key] = (f0, fps)
+
+        f0, fps = cached
+        start_frame = max(0, int(start_time * fps))
+        end_frame = min(len(f0), int(end_time * fps))
+        return f0[start_frame:end_frame]
+
+    def _f0_cache_path(
+        self,
+        audio_path: str,
+        fmin_hz: float,
+        fmax_hz: float
+    ) -> Optional[Path]:
+        """
+        Build the cache file path for an F0 extraction
+
+        Args:
+            audio_path: Input audio file path
+            fmin_hz: Minimum F0 hypothesis in Hz
+            fmax_hz: Maximum F0 hypothesis in Hz
+
+        Returns:
+            Cache .npy path, or None if the file cannot be hashed
+        """
+        import hashlib
+        import mmap
+        import os
+
+        try:
+            digest = hashlib.blake2b(digest_size=16)
+            with open(audio_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        digest.update(mm)
+            self._f0_cache_dir.mkdir(exist_ok=True, parents=True)
+            return self._f0_cache_dir / f"{digest.hexdigest()}_{fmin_hz:g}_{fmax_hz:g}.npy"
+        except OSError as e:
+            logger.warning(f"F0 cache unavailable: {e}")
+            return None
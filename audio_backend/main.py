@@ -11,7 +11,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException, BackgroundTasks
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, BackgroundTasks, Request, Response
 from fastapi.responses import FileResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -30,11 +30,20 @@ from audio_backend.integrations.swiftf0_wrapper import SwiftF0Wrapper
 from audio_backend.integrations.svc_wrapper import SVCWrapper
 from audio_backend.integrations.instrumental_wrapper import InstrumentalWrapper
 
+# Prefer orjson for response encoding when installed (the progress
+# endpoint is polled at high frequency by the UI)
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponseClass
+except ImportError:
+    DefaultResponseClass = JSONResponse
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Wan2GP Audio Studio API",
     description="Audio processing pipeline with segment-by-segment workflow",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=DefaultResponseClass
 )
 
 # CORS configuration
@@ -65,9 +74,33 @@ STATIC_DIR = PROJECT_ROOT / "audio_frontend" / "dist"
 for directory in [UPLOAD_DIR, OUTPUT_DIR, TEMP_DIR]:
     directory.mkdir(exist_ok=True)
 
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles with long-lived caching for hashed frontend assets
+
+    Bundled JS/CSS/wasm filenames change when their content changes, so
+    browsers can cache them for a year and skip the request entirely on
+    repeat page loads; HTML entry points stay no-cache so deploys are
+    picked up immediately.
+    """
+
+    _IMMUTABLE_SUFFIXES = {
+        ".js", ".css", ".wasm", ".woff", ".woff2",
+        ".svg", ".png", ".ico"
+    }
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if Path(full_path).suffix.lower() in self._IMMUTABLE_SUFFIXES:
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            response.headers["Cache-Control"] = "no-cache"
+        return response
+
+
 # Mount static files for frontend
 if STATIC_DIR.exists():
-    app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
+    app.mount("/static", CachedStaticFiles(directory=str(STATIC_DIR)), name="static")
 
 
 # ==================== Pydantic Models ====================
@@ -134,13 +167,18 @@ async def upload_audio(file: UploadFile = File(...)):
         safe_filename = f"{file_id}{file_extension}"
         file_path = UPLOAD_DIR / safe_filename
         
-        # Save uploaded file
+        # Stream the upload to disk in 1 MB chunks instead of buffering
+        # the whole file in memory
+        import shutil
+
+        loop = asyncio.get_running_loop()
         with open(file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
-        
+            await loop.run_in_executor(
+                None, shutil.copyfileobj, file.file, buffer, 1 << 20
+            )
+
         # Get basic file info
-        file_size = len(content)
+        file_size = file_path.stat().st_size
         
         return {
             "file_id": file_id,
@@ -289,8 +327,40 @@ async def cancel_job(job_id: str):
     }
 
 
+def _audio_file_response(path: str, filename: str, request: Request) -> Response:
+    """
+    Build a FileResponse for an audio file with ETag revalidation
+
+    The file is stat'ed once and the result handed to FileResponse so it
+    is not re-stat'ed per request; the mtime/size ETag lets browsers
+    short-circuit repeated preview polls with a 304 instead of
+    re-downloading megabytes of WAV.
+
+    Args:
+        path: Audio file path
+        filename: Download filename
+        request: Incoming request (for If-None-Match)
+
+    Returns:
+        FileResponse, or an empty 304 response on an ETag match
+    """
+    st = os.stat(path)
+    etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return FileResponse(
+        path=path,
+        stat_result=st,
+        media_type="audio/wav",
+        filename=filename,
+        headers={"ETag": etag}
+    )
+
+
 @app.get("/jobs/{job_id}/preview")
-async def get_preview(job_id: str, segment_index: Optional[int] = None):
+async def get_preview(request: Request, job_id: str, segment_index: Optional[int] = None):
     """
     Get preview audio for a job or specific segment
     
@@ -317,15 +387,11 @@ async def get_preview(job_id: str, segment_index: Optional[int] = None):
     if not preview_path or not Path(preview_path).exists():
         raise HTTPException(status_code=404, detail="Preview not available")
     
-    return FileResponse(
-        path=preview_path,
-        media_type="audio/wav",
-        filename=f"preview_{job_id}.wav"
-    )
+    return _audio_file_response(preview_path, f"preview_{job_id}.wav", request)
 
 
 @app.get("/jobs/{job_id}/download")
-async def download_result(job_id: str):
+async def download_result(request: Request, job_id: str):
     """
     Download final processed audio
     
@@ -346,11 +412,7 @@ async def download_result(job_id: str):
     if not output_path or not Path(output_path).exists():
         raise HTTPException(status_code=404, detail="Output file not found")
     
-    return FileResponse(
-        path=output_path,
-        media_type="audio/wav",
-        filename=f"result_{job_id}.wav"
-    )
+    return _audio_file_response(output_path, f"result_{job_id}.wav", request)
 
 
 @app.get("/jobs/{job_id}/segments")
@@ -496,10 +558,11 @@ async def get_rtx3070_profile():
         "sample_rate": 48000,
         "bit_depth": 16,
         "channels": 2,
+        "dtype": "bf16",
         "optimization_tips": [
             "Use segment-by-segment processing for better VRAM management",
             "Enable gradient checkpointing where supported",
-            "Use mixed precision (FP16) when available",
+            "Use mixed precision (BF16/FP16) when available",
             "Clear CUDA cache between segments",
             "Limit concurrent segment processing to 2"
         ]
@@ -516,10 +579,14 @@ def start_server(host: str = "127.0.0.1", port: int = 8000):
         host: Host to bind to
         port: Port to listen on
     """
+    import importlib.util
+
     uvicorn.run(
         app,
         host=host,
         port=port,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "auto",
+        http="httptools" if importlib.util.find_spec("httptools") else "auto",
         log_level="info"
     )
 
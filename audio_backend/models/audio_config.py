@@ -2,10 +2,38 @@
 Audio Processing Configuration
 Pydantic models for audio processing configuration
 """
-from typing import Optional, List, Dict, Any, Literal
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Literal, Tuple
 from pydantic import BaseModel, Field, validator
 from enum import Enum
 
+# Valid pipeline stage names, hoisted so the validator does O(1) set
+# membership instead of rebuilding a list per invocation
+_VALID_STAGES = frozenset({"swiftf0", "svc", "instrumental", "mixing"})
+
+
+@lru_cache(maxsize=256)
+def _check_stages(stages: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Validate a pipeline stage tuple (memoized)
+
+    Clients send the same few stage orderings over and over, so the
+    verdict for each distinct tuple is cached.
+
+    Args:
+        stages: Pipeline stage names
+
+    Returns:
+        The input tuple, unchanged
+
+    Raises:
+        ValueError: If any stage name is unknown
+    """
+    bad = [s for s in stages if s not in _VALID_STAGES]
+    if bad:
+        raise ValueError(f"Invalid pipeline stage: {bad[0]}")
+    return stages
+
 
 class SVCVariant(str, Enum):
     """SVC model variants"""
@@ -269,34 +297,40 @@ class AudioProcessingConfig(BaseModel):
     @validator('pipeline_stages')
     def validate_pipeline_stages(cls, v):
         """Validate that pipeline stages are valid"""
-        valid_stages = ["swiftf0", "svc", "instrumental", "mixing"]
-        for stage in v:
-            if stage not in valid_stages:
-                raise ValueError(f"Invalid pipeline stage: {stage}")
+        _check_stages(tuple(v))
         return v
     
     def get_rtx3070_profile(self) -> "AudioProcessingConfig":
         """
         Get RTX 3070 optimized configuration
-        
+
         Returns:
             Optimized configuration for RTX 3070 (8GB VRAM)
         """
-        config = self.copy()
-        
-        # Optimize for RTX 3070
-        config.processing.max_concurrent_segments = 2
-        config.processing.segment_length = 30.0
-        config.processing.clear_cache_between_segments = True
-        
-        # Use reasonable quality settings
-        config.quality.sample_rate = 48000
-        config.quality.bit_depth = 16
-        
-        return config
-
-
-# Pre-configured profiles
+        # copy(update=...) applies the constant overrides without a
+        # deep copy or re-validation; replacing the sub-models (rather
+        # than mutating them) also keeps the source config untouched
+        return self.copy(update={
+            "processing": self.processing.copy(update=_RTX3070_PROCESSING),
+            "quality": self.quality.copy(update=_RTX3070_QUALITY)
+        })
+
+
+# RTX 3070 field overrides, applied via copy(update=...) so profile
+# requests never deep-copy or re-validate the whole config tree
+_RTX3070_PROCESSING = {
+    "max_concurrent_segments": 2,
+    "segment_length": 30.0,
+    "clear_cache_between_segments": True
+}
+_RTX3070_QUALITY = {
+    "sample_rate": 48000,
+    "bit_depth": 16
+}
+
+
+# Pre-configured profiles (built once; callers treat them as read-only)
+@lru_cache(maxsize=1)
 def get_rtx3070_fast_profile() -> AudioProcessingConfig:
     """Get fast profile for RTX 3070 (lower quality, faster)"""
     return AudioProcessingConfig(
@@ -311,6 +345,7 @@ def get_rtx3070_fast_profile() -> AudioProcessingConfig:
     )
 
 
+@lru_cache(maxsize=1)
 def get_rtx3070_quality_profile() -> AudioProcessingConfig:
     """Get quality profile for RTX 3070 (higher quality, slower)"""
     return AudioProcessingConfig(
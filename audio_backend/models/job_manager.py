@@ -2,6 +2,15 @@
 Job Manager for Audio Processing
 Handles job lifecycle, status tracking, and result management
 """
+import heapq
+import os
+import secrets
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+import sqlite3
+import sys
+import threading
+import time
 import uuid
 from datetime import datetime
 from typing import Dict, List, Optional, Any
@@ -9,7 +18,95 @@ from enum import Enum
 from pathlib import Path
 import json
 
-from audio_backend.models.audio_config import AudioProcessingConfig
+# Prefer orjson for metadata encoding when installed: the save path
+# runs on every progress tick, and the C encoder skips the per-node
+# Python dispatch of the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# msgspec encodes typed structs straight to JSON with no intermediate
+# dict pass at all, which beats even orjson on the save path
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if msgspec is not None:
+    class _SegmentS(msgspec.Struct):
+        """Serialization mirror of AudioSegment (no validation)"""
+        index: int
+        start_time: float
+        end_time: float
+        duration: float
+        original_path: Optional[str]
+        status: str
+        preview_path: Optional[str]
+        result_path: Optional[str]
+        metadata: Dict
+
+    class _JobS(msgspec.Struct):
+        """Serialization mirror of ProcessingJob (no validation)"""
+        job_id: str
+        status: str
+        progress: float
+        current_stage: str
+        segments_completed: int
+        segments_total: int
+        message: str
+        config: Dict
+        segments: List[_SegmentS]
+        results: Dict
+        created_at: str
+        updated_at: str
+        preview_url: Optional[str]
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode metadata to JSON bytes with the fastest available encoder"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, default=str).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode metadata JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _time_ordered_id() -> str:
+    """
+    Generate a time-ordered job id (UUIDv7 bit layout)
+
+    Random UUID4 ids scatter metadata files arbitrarily through the
+    storage directory; a millisecond-timestamp prefix keeps ids — and
+    the files and database rows named after them — in chronological
+    order, which groups writes and helps directory-entry locality.
+
+    Returns:
+        Canonical UUID string whose lexicographic order is creation order
+    """
+    ts_ms = time.time_ns() // 1_000_000
+    value = (ts_ms & 0xFFFFFFFFFFFF) << 80          # unix_ts_ms (48 bits)
+    value |= 0x7 << 76                              # version 7
+    value |= secrets.randbits(12) << 64             # rand_a
+    value |= 0b10 << 62                             # variant
+    value |= secrets.randbits(62)                   # rand_b
+    return str(uuid.UUID(int=value))
+
+
+from audio_backend.models.audio_config import (
+    AudioProcessingConfig,
+    ProcessingConfig,
+    AudioQualityConfig,
+    SwiftF0Config,
+    SVCConfig,
+    InstrumentalConfig,
+    MixingConfig
+)
 
 
 class JobStatus(Enum):
@@ -22,9 +119,27 @@ class JobStatus(Enum):
     CANCELLED = "cancelled"
 
 
+# O(1) status lookup tables: avoid exception-driven Enum construction
+# for filters and per-call list literals for membership checks
+_STATUS_BY_NAME = {s.value: s for s in JobStatus}
+# Interned status strings: serialization does a plain dict lookup
+# instead of the Enum .value descriptor per segment
+_STATUS_VALUE = {s: sys.intern(s.value) for s in JobStatus}
+_CANCELLABLE = frozenset({JobStatus.QUEUED, JobStatus.RUNNING})
+# Statuses that count a segment as done for progress purposes
+_TERMINAL = frozenset({JobStatus.COMPLETED, JobStatus.FAILED})
+
+
 class AudioSegment:
     """Represents a single audio segment for processing"""
-    
+
+    # Segments are created in bulk (one per slice of the input), so the
+    # per-instance dict is worth dropping
+    __slots__ = (
+        'index', 'start_time', 'end_time', 'duration', 'original_path',
+        'status', 'preview_path', 'result_path', 'metadata', '_dict_cache'
+    )
+
     def __init__(
         self,
         index: int,
@@ -41,25 +156,44 @@ class AudioSegment:
         self.preview_path: Optional[str] = None
         self.result_path: Optional[str] = None
         self.metadata: Dict = {}
-    
+        self._dict_cache: Optional[Dict] = None
+
     def to_dict(self) -> Dict:
-        """Convert to dictionary"""
-        return {
-            "index": self.index,
-            "start_time": self.start_time,
-            "end_time": self.end_time,
-            "duration": self.duration,
-            "original_path": self.original_path,
-            "status": self.status.value,
-            "preview_path": self.preview_path,
-            "result_path": self.result_path,
-            "metadata": self.metadata
-        }
+        """Convert to dictionary (cached until the segment changes)"""
+        # The whole job is serialized on every metadata flush, but an
+        # individual segment changes only a handful of times over its
+        # life; reusing the payload avoids rebuilding hundreds of
+        # identical dicts per save on long jobs. Read the cache into a
+        # local: a status update can invalidate it from another thread
+        # between populate and return, and re-reading the attribute
+        # would then hand the serializer a None
+        cache = self._dict_cache
+        if cache is None:
+            cache = self._dict_cache = {
+                "index": self.index,
+                "start_time": self.start_time,
+                "end_time": self.end_time,
+                "duration": self.duration,
+                "original_path": self.original_path,
+                "status": _STATUS_VALUE[self.status],
+                "preview_path": self.preview_path,
+                "result_path": self.result_path,
+                "metadata": self.metadata
+            }
+        return cache
 
 
 class ProcessingJob:
     """Represents a complete audio processing job"""
-    
+
+    __slots__ = (
+        'job_id', 'config', '_config_dict', 'status', 'progress',
+        'current_stage', 'segments_completed', 'segments_total', 'message',
+        'created_at', '_updated_ns', 'results', 'preview_url', 'segments',
+        '_metadata_path', '_metadata_tmp_path'
+    )
+
+
     def __init__(
         self,
         job_id: str,
@@ -68,6 +202,9 @@ class ProcessingJob:
     ):
         self.job_id = job_id
         self.config = config
+        # The config never mutates after creation, so serialize it once
+        # here instead of re-walking the Pydantic tree on every save
+        self._config_dict = config.dict()
         self.status = JobStatus.QUEUED
         self.progress = 0.0
         self.current_stage = "initialization"
@@ -75,7 +212,9 @@ class ProcessingJob:
         self.segments_total = len(segments)
         self.message = "Job created"
         self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        # Update stamps are hot (every progress tick), so they are kept
+        # as integer nanoseconds and only formatted when serialized
+        self._updated_ns = time.time_ns()
         self.results: Dict = {}
         self.preview_url: Optional[str] = None
         
@@ -100,7 +239,7 @@ class ProcessingJob:
         self.progress = progress
         self.current_stage = current_stage
         self.message = message
-        self.updated_at = datetime.now()
+        self._updated_ns = time.time_ns()
     
     def update_segment_status(
         self,
@@ -111,30 +250,44 @@ class ProcessingJob:
     ):
         """Update status of a specific segment"""
         if 0 <= segment_index < len(self.segments):
-            self.segments[segment_index].status = status
+            segment = self.segments[segment_index]
+            old_status = segment.status
+            segment.status = status
             if preview_path:
-                self.segments[segment_index].preview_path = preview_path
+                segment.preview_path = preview_path
             if result_path:
-                self.segments[segment_index].result_path = result_path
-            
-            # Update completed count
-            self.segments_completed = sum(
-                1 for seg in self.segments
-                if seg.status in [JobStatus.COMPLETED, JobStatus.FAILED]
-            )
-            self.updated_at = datetime.now()
-    
+                segment.result_path = result_path
+            segment._dict_cache = None
+
+            # Maintain the completed count incrementally: the old full
+            # rescan made every update O(segments), O(n^2) over a job
+            if status in _TERMINAL:
+                if old_status not in _TERMINAL:
+                    self.segments_completed += 1
+            elif old_status in _TERMINAL:
+                self.segments_completed -= 1
+            self._updated_ns = time.time_ns()
+
+    @property
+    def updated_at(self) -> datetime:
+        """Last-update time (stored as integer nanoseconds internally)"""
+        return datetime.fromtimestamp(self._updated_ns / 1e9)
+
+    @updated_at.setter
+    def updated_at(self, value: datetime):
+        self._updated_ns = int(value.timestamp() * 1e9)
+
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
         return {
             "job_id": self.job_id,
-            "status": self.status.value,
+            "status": _STATUS_VALUE[self.status],
             "progress": self.progress,
             "current_stage": self.current_stage,
             "segments_completed": self.segments_completed,
             "segments_total": self.segments_total,
             "message": self.message,
-            "config": self.config.dict(),
+            "config": self._config_dict,
             "segments": [seg.to_dict() for seg in self.segments],
             "results": self.results,
             "created_at": self.created_at.isoformat(),
@@ -142,14 +295,115 @@ class ProcessingJob:
             "preview_url": self.preview_url
         }
 
+    def to_struct(self) -> "_JobS":
+        """
+        Build the msgspec serialization mirror (msgspec required)
+
+        Returns:
+            _JobS struct ready for msgspec.json.encode
+        """
+        return _JobS(
+            job_id=self.job_id,
+            status=_STATUS_VALUE[self.status],
+            progress=self.progress,
+            current_stage=self.current_stage,
+            segments_completed=self.segments_completed,
+            segments_total=self.segments_total,
+            message=self.message,
+            config=self._config_dict,
+            segments=[
+                _SegmentS(
+                    index=seg.index,
+                    start_time=seg.start_time,
+                    end_time=seg.end_time,
+                    duration=seg.duration,
+                    original_path=seg.original_path,
+                    status=_STATUS_VALUE[seg.status],
+                    preview_path=seg.preview_path,
+                    result_path=seg.result_path,
+                    metadata=seg.metadata
+                )
+                for seg in self.segments
+            ],
+            results=self.results,
+            created_at=self.created_at.isoformat(),
+            updated_at=self.updated_at.isoformat(),
+            preview_url=self.preview_url
+        )
+
 
 class JobManager:
     """Manages audio processing jobs"""
     
     def __init__(self, storage_dir: Optional[Path] = None):
         self.jobs: Dict[str, ProcessingJob] = {}
+        # Guards compound operations on self.jobs (snapshot + mutate);
+        # single dict reads stay lock-free under the GIL
+        self._jobs_lock = threading.RLock()
         self.storage_dir = storage_dir or Path("./audio_output")
         self.storage_dir.mkdir(exist_ok=True, parents=True)
+        self._db = self._open_db()
+
+        # Progress ticks mark jobs dirty instead of writing synchronously;
+        # a daemon thread coalesces them into one write per interval.
+        # Terminal transitions still save directly so nothing is lost.
+        self._dirty: set = set()
+        self._dirty_lock = threading.Lock()
+        self._flush_interval = 0.2
+        self._flusher = threading.Thread(
+            target=self._flush_loop,
+            name="jobmeta-flush",
+            daemon=True
+        )
+        self._flusher.start()
+
+        # Every metadata save (create/terminal transitions and flusher
+        # batches) goes through a single-thread executor so pipeline
+        # callbacks never block on disk and one worker keeps all writes
+        # for a job ordered
+        self._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix='jobmeta')
+        self._inflight: Dict[str, Any] = {}
+
+        # Per-job append-only event logs: hot updates write one small
+        # JSONL delta instead of the full snapshot; handles stay open
+        # to avoid per-tick open/close syscalls
+        self._event_files: Dict[str, Any] = {}
+
+        # Directory fd for batched durability: one fsync per flush tick
+        # covers every rename in that batch (not available on Windows)
+        self._dir_fd: Optional[int] = None
+        if hasattr(os, 'O_DIRECTORY'):
+            try:
+                self._dir_fd = os.open(str(self.storage_dir), os.O_DIRECTORY)
+            except OSError:
+                pass
+
+    def _open_db(self) -> sqlite3.Connection:
+        """
+        Open the SQLite job store in WAL mode
+
+        The in-memory dict stays the hot read path; the WAL database
+        persists jobs across restarts and lets multiple worker processes
+        share state without stepping on each other.
+
+        Returns:
+            SQLite connection
+        """
+        db = sqlite3.connect(
+            str(self.storage_dir / "jobs.db"),
+            check_same_thread=False
+        )
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "job_id TEXT PRIMARY KEY, "
+            "status TEXT, "
+            "created_at TEXT, "
+            "data TEXT)"
+        )
+        db.commit()
+        return db
     
     def create_job(
         self,
@@ -166,10 +420,12 @@ class JobManager:
         Returns:
             Job ID
         """
-        job_id = str(uuid.uuid4())
+        job_id = _time_ordered_id()
         job = ProcessingJob(job_id, config, segments)
-        self.jobs[job_id] = job
-        self._save_job_metadata(job)
+        self._assign_paths(job)
+        with self._jobs_lock:
+            self.jobs[job_id] = job
+        self._submit_save(job)
         return job_id
     
     def get_job(self, job_id: str) -> Optional[ProcessingJob]:
@@ -206,7 +462,13 @@ class JobManager:
             job.message = message
             if progress is not None:
                 job.progress = progress
-            self._save_job_metadata(job)
+            self._append_event(job_id, {
+                "t": "status",
+                "status": status.value,
+                "message": message,
+                "progress": progress
+            })
+            self._mark_dirty(job_id)
     
     def update_job_progress(
         self,
@@ -227,7 +489,13 @@ class JobManager:
         job = self.get_job(job_id)
         if job:
             job.update_progress(progress, current_stage, message)
-            self._save_job_metadata(job)
+            self._append_event(job_id, {
+                "t": "progress",
+                "progress": progress,
+                "stage": current_stage,
+                "message": message
+            })
+            self._mark_dirty(job_id)
     
     def update_segment_status(
         self,
@@ -250,7 +518,14 @@ class JobManager:
         job = self.get_job(job_id)
         if job:
             job.update_segment_status(segment_index, status, preview_path, result_path)
-            self._save_job_metadata(job)
+            self._append_event(job_id, {
+                "t": "segment",
+                "index": segment_index,
+                "status": status.value,
+                "preview_path": preview_path,
+                "result_path": result_path
+            })
+            self._mark_dirty(job_id)
     
     def complete_job(self, job_id: str, results: Dict):
         """
@@ -268,7 +543,7 @@ class JobManager:
             job.message = "Job completed successfully"
             job.results = results
             job.updated_at = datetime.now()
-            self._save_job_metadata(job)
+            self._finalize_job(job)
     
     def fail_job(self, job_id: str, error_message: str):
         """
@@ -284,7 +559,7 @@ class JobManager:
             job.current_stage = "failed"
             job.message = f"Job failed: {error_message}"
             job.updated_at = datetime.now()
-            self._save_job_metadata(job)
+            self._finalize_job(job)
     
     def cancel_job(self, job_id: str) -> bool:
         """
@@ -297,11 +572,11 @@ class JobManager:
             True if cancelled, False otherwise
         """
         job = self.get_job(job_id)
-        if job and job.status in [JobStatus.QUEUED, JobStatus.RUNNING]:
+        if job and job.status in _CANCELLABLE:
             job.status = JobStatus.CANCELLED
             job.message = "Job cancelled"
             job.updated_at = datetime.now()
-            self._save_job_metadata(job)
+            self._finalize_job(job)
             return True
         return False
     
@@ -320,22 +595,22 @@ class JobManager:
         Returns:
             List of job dictionaries
         """
-        jobs = list(self.jobs.values())
-        
-        # Filter by status
+        # Snapshot under the lock so a concurrent delete cannot resize
+        # the dict mid-iteration; the heap selection runs lock-free
+        with self._jobs_lock:
+            candidates = list(self.jobs.values())
+
+        # Filter by status (lazily, no intermediate list); unknown
+        # filter values are ignored as before
         if status_filter:
-            try:
-                filter_status = JobStatus(status_filter.lower())
-                jobs = [j for j in jobs if j.status == filter_status]
-            except ValueError:
-                pass
-        
-        # Sort by creation time (newest first)
-        jobs.sort(key=lambda j: j.created_at, reverse=True)
-        
-        # Limit results
-        jobs = jobs[:limit]
-        
+            filter_status = _STATUS_BY_NAME.get(status_filter.lower())
+            if filter_status is not None:
+                candidates = (j for j in candidates if j.status is filter_status)
+
+        # Newest first: a bounded heap is O(n log limit) instead of the
+        # full O(n log n) sort-then-slice
+        jobs = heapq.nlargest(limit, candidates, key=lambda j: j.created_at)
+
         return [job.to_dict() for job in jobs]
     
     def delete_job(self, job_id: str) -> bool:
@@ -348,23 +623,332 @@ class JobManager:
         Returns:
             True if deleted, False otherwise
         """
-        if job_id in self.jobs:
-            # Delete job files
-            job = self.jobs[job_id]
-            job_dir = self.storage_dir / job_id
-            if job_dir.exists():
-                import shutil
-                shutil.rmtree(job_dir)
-            
-            # Delete metadata
-            metadata_file = self.storage_dir / f"{job_id}_metadata.json"
-            if metadata_file.exists():
-                metadata_file.unlink()
-            
-            del self.jobs[job_id]
-            return True
-        return False
+        # Claim the job under the lock so two concurrent deletes (or a
+        # delete racing list_jobs' snapshot) cannot double-clean
+        with self._jobs_lock:
+            job = self.jobs.pop(job_id, None)
+        if job is None:
+            return False
+
+        # Drop any pending flush so the metadata is not recreated,
+        # and wait out an in-flight write for the same reason
+        with self._dirty_lock:
+            self._dirty.discard(job_id)
+        self._close_events(job_id, remove=True)
+        inflight = self._inflight.get(job_id)
+        if inflight is not None:
+            try:
+                inflight.result()
+            except Exception:
+                pass
+
+        # Delete job files (outside the lock: disk work must not block
+        # other API calls)
+        job_dir = self.storage_dir / job_id
+        if job_dir.exists():
+            shutil.rmtree(job_dir)
+
+        # Delete metadata (unconditional unlink skips the stat)
+        metadata_file = self.storage_dir / f"{job_id}_metadata.json"
+        metadata_file.unlink(missing_ok=True)
+
+        self._db.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+        self._db.commit()
+
+        return True
     
+    def _append_event(self, job_id: str, event: Dict):
+        """
+        Append a delta event to the job's JSONL log
+
+        Progress ticks change a few fields of an otherwise-identical
+        payload, so each tick appends O(delta) bytes here while the
+        full snapshot is refreshed by the background flusher.
+
+        Args:
+            job_id: Job identifier
+            event: Event dictionary (must carry a "t" type key)
+        """
+        handle = self._event_files.get(job_id)
+        if handle is None:
+            try:
+                handle = open(self.storage_dir / f"{job_id}.events.jsonl", 'ab')
+            except OSError:
+                return
+            self._event_files[job_id] = handle
+
+        if orjson is not None:
+            line = orjson.dumps(event, default=str)
+        else:
+            line = json.dumps(event, default=str).encode("utf-8")
+        try:
+            handle.write(line + b"\n")
+        except OSError:
+            pass
+
+    def _close_events(self, job_id: str, remove: bool = False):
+        """
+        Close (and optionally delete) a job's event log
+
+        Args:
+            job_id: Job identifier
+            remove: Also delete the log file
+        """
+        handle = self._event_files.pop(job_id, None)
+        if handle is not None:
+            try:
+                handle.close()
+            except OSError:
+                pass
+        if remove:
+            events_file = self.storage_dir / f"{job_id}.events.jsonl"
+            try:
+                events_file.unlink()
+            except OSError:
+                pass
+
+    def _finalize_job(self, job: ProcessingJob):
+        """
+        Persist a terminal transition and retire the event log
+
+        The terminal status is appended to the log first, so a crash
+        before the snapshot lands still replays to the terminal state.
+        Once the snapshot save succeeds, the log is deleted: replay can
+        then never walk stale pre-terminal events on top of it, and
+        finished jobs don't leave .events.jsonl files behind.
+
+        Args:
+            job: ProcessingJob already set to a terminal status
+        """
+        self._append_event(job.job_id, {
+            "t": "status",
+            "status": job.status.value,
+            "message": job.message,
+            "progress": job.progress
+        })
+        self._close_events(job.job_id)
+        self._submit_save(job, remove_events=True)
+
+    def _submit_save(self, job: ProcessingJob, remove_events: bool = False):
+        """
+        Write a job's metadata on the I/O executor
+
+        Args:
+            job: ProcessingJob to save
+            remove_events: Delete the job's event log after a successful
+                save (used for terminal snapshots)
+
+        Returns:
+            Future for the queued save
+        """
+        future = self._io.submit(self._save_job_metadata, job)
+        self._inflight[job.job_id] = future
+
+        def _done(f, job_id=job.job_id):
+            self._inflight.pop(job_id, None)
+            if remove_events and f.exception() is None:
+                try:
+                    (self.storage_dir / f"{job_id}.events.jsonl").unlink()
+                except OSError:
+                    pass
+
+        future.add_done_callback(_done)
+        return future
+
+    def _mark_dirty(self, job_id: str):
+        """
+        Queue a job for the next background metadata flush
+
+        Args:
+            job_id: Job identifier
+        """
+        with self._dirty_lock:
+            self._dirty.add(job_id)
+
+    def _flush_loop(self):
+        """Flush dirty job metadata at a bounded rate (daemon thread)"""
+        while True:
+            time.sleep(self._flush_interval)
+
+            with self._dirty_lock:
+                if not self._dirty:
+                    continue
+                dirty_ids = list(self._dirty)
+                self._dirty.clear()
+
+            # Route every write through the single I/O worker: writing
+            # directly from this thread raced the executor's saves on
+            # the same .tmp path, and queuing via _submit_save registers
+            # the future in _inflight so delete_job waits these out too
+            futures = []
+            for job_id in dirty_ids:
+                job = self.jobs.get(job_id)
+                if job is None:
+                    continue
+                futures.append(self._submit_save(job))
+
+            wrote = False
+            for future in futures:
+                try:
+                    future.result()
+                    wrote = True
+                except Exception:
+                    # Last-write-wins: a failed tick is superseded by
+                    # the next one, or by the terminal direct save
+                    pass
+
+            # One fsync on the directory covers the whole batch of
+            # renames, amortizing the most expensive syscall here
+            if wrote and self._dir_fd is not None:
+                try:
+                    os.fsync(self._dir_fd)
+                except OSError:
+                    pass
+
+    def rehydrate_job(self, job_id: str) -> Optional[ProcessingJob]:
+        """
+        Rebuild a ProcessingJob from persisted metadata without validation
+
+        The metadata was written by this service, so re-running every
+        Pydantic field constraint and validator on reload is pure
+        overhead; construct() skips validation entirely. User-supplied
+        configs arriving through the API still go through full
+        validation on the way in.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Rehydrated ProcessingJob (registered in self.jobs) or None
+        """
+        data = self.load_job_metadata(job_id)
+        if data is None:
+            return None
+
+        cfg = dict(data.get("config", {}))
+        for field, model in (
+            ("processing", ProcessingConfig),
+            ("quality", AudioQualityConfig),
+            ("swiftf0", SwiftF0Config),
+            ("svc", SVCConfig),
+            ("instrumental", InstrumentalConfig),
+            ("mixing", MixingConfig)
+        ):
+            if isinstance(cfg.get(field), dict):
+                cfg[field] = model.construct(**cfg[field])
+        config = AudioProcessingConfig.construct(**cfg)
+
+        job = object.__new__(ProcessingJob)
+        job.job_id = data["job_id"]
+        job.config = config
+        job._config_dict = data.get("config", {})
+        job.status = JobStatus(data["status"])
+        job.progress = data.get("progress", 0.0)
+        job.current_stage = data.get("current_stage", "initialization")
+        job.segments_completed = data.get("segments_completed", 0)
+        job.segments_total = data.get("segments_total", 0)
+        job.message = data.get("message", "")
+        job.created_at = datetime.fromisoformat(data["created_at"])
+        job.updated_at = datetime.fromisoformat(data["updated_at"])
+        job.results = data.get("results", {})
+        job.preview_url = data.get("preview_url")
+        job.segments = [
+            self._rehydrate_segment(seg) for seg in data.get("segments", [])
+        ]
+
+        self._replay_events(job)
+        self._assign_paths(job)
+
+        self.jobs[job.job_id] = job
+        return job
+
+    def _assign_paths(self, job: ProcessingJob):
+        """
+        Cache the job's storage paths on the instance
+
+        The save path runs every flush tick; building the Path (string
+        format plus allocation) once per job instead of per save keeps
+        that loop to attribute reads.
+
+        Args:
+            job: ProcessingJob to annotate
+        """
+        job._metadata_path = self.storage_dir / f"{job.job_id}_metadata.json"
+        job._metadata_tmp_path = self.storage_dir / f"{job.job_id}_metadata.json.tmp"
+
+    def _replay_events(self, job: ProcessingJob):
+        """
+        Apply logged delta events on top of a rehydrated snapshot
+
+        The snapshot lags the event log by up to one flush interval, so
+        any trailing events carry the freshest state. Replaying from
+        the start is safe: the setters are last-write-wins and the
+        segment counter adjusts on actual transitions only.
+
+        Args:
+            job: Rehydrated ProcessingJob
+        """
+        # A terminal snapshot is already the final state; any surviving
+        # log predates it and must not regress the job
+        if job.status in _TERMINAL or job.status is JobStatus.CANCELLED:
+            return
+
+        events_file = self.storage_dir / f"{job.job_id}.events.jsonl"
+        if not events_file.exists():
+            return
+
+        try:
+            for line in events_file.read_bytes().splitlines():
+                if not line:
+                    continue
+                event = _json_loads(line)
+                kind = event.get("t")
+                if kind == "progress":
+                    job.update_progress(
+                        event["progress"], event["stage"], event["message"]
+                    )
+                elif kind == "segment":
+                    job.update_segment_status(
+                        event["index"],
+                        JobStatus(event["status"]),
+                        event.get("preview_path"),
+                        event.get("result_path")
+                    )
+                elif kind == "status":
+                    job.status = JobStatus(event["status"])
+                    job.message = event.get("message", job.message)
+                    if event.get("progress") is not None:
+                        job.progress = event["progress"]
+        except Exception:
+            # A torn trailing line just means the snapshot state stands
+            pass
+
+    @staticmethod
+    def _rehydrate_segment(data: Dict) -> AudioSegment:
+        """
+        Rebuild an AudioSegment from its to_dict form without __init__
+
+        Args:
+            data: Segment dictionary
+
+        Returns:
+            AudioSegment instance
+        """
+        segment = object.__new__(AudioSegment)
+        segment.index = data["index"]
+        segment.start_time = data["start_time"]
+        segment.end_time = data["end_time"]
+        segment.duration = data.get(
+            "duration", data["end_time"] - data["start_time"]
+        )
+        segment.original_path = data.get("original_path")
+        segment.status = JobStatus(data.get("status", JobStatus.QUEUED.value))
+        segment.preview_path = data.get("preview_path")
+        segment.result_path = data.get("result_path")
+        segment.metadata = data.get("metadata", {})
+        segment._dict_cache = None
+        return segment
+
     def _save_job_metadata(self, job: ProcessingJob):
         """
         Save job metadata to disk
@@ -372,9 +956,22 @@ class JobManager:
         Args:
             job: ProcessingJob to save
         """
-        metadata_file = self.storage_dir / f"{job.job_id}_metadata.json"
-        with open(metadata_file, 'w') as f:
-            json.dump(job.to_dict(), f, indent=2, default=str)
+        if msgspec is not None:
+            payload = msgspec.json.encode(job.to_struct(), enc_hook=str)
+        else:
+            payload = _json_dumps(job.to_dict())
+
+        # Write-then-rename keeps the metadata file whole even if the
+        # process dies mid-write
+        job._metadata_tmp_path.write_bytes(payload)
+        os.replace(job._metadata_tmp_path, job._metadata_path)
+
+        self._db.execute(
+            "INSERT INTO jobs(job_id, status, created_at, data) VALUES(?, ?, ?, ?) "
+            "ON CONFLICT(job_id) DO UPDATE SET status=excluded.status, data=excluded.data",
+            (job.job_id, job.status.value, job.created_at.isoformat(), payload)
+        )
+        self._db.commit()
     
     def load_job_metadata(self, job_id: str) -> Optional[Dict]:
         """
@@ -388,6 +985,12 @@ class JobManager:
         """
         metadata_file = self.storage_dir / f"{job_id}_metadata.json"
         if metadata_file.exists():
-            with open(metadata_file, 'r') as f:
-                return json.load(f)
+            return _json_loads(metadata_file.read_bytes())
+
+        # Fall back to the WAL store (jobs created by another worker)
+        row = self._db.execute(
+            "SELECT data FROM jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        if row:
+            return _json_loads(row[0])
         return None
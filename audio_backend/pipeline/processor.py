@@ -6,10 +6,6 @@ import asyncio
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-import torch
-import torchaudio
-import numpy as np
-import librosa
 
 from audio_backend.models.job_manager import JobManager, JobStatus
 from audio_backend.models.audio_config import AudioProcessingConfig
@@ -23,6 +19,12 @@ class AudioPipelineProcessor:
     def __init__(self, temp_dir: Optional[Path] = None):
         self.temp_dir = temp_dir or Path("./audio_temp")
         self.temp_dir.mkdir(exist_ok=True, parents=True)
+        # Largest segment (in samples) the CUDA allocator was warmed
+        # for; see _warmup_allocator
+        self._warmed_samples = 0
+        # Existence verdicts for the current process() run, so each
+        # path is stat'ed at most once per job
+        self._exists_cache: Dict[str, bool] = {}
         
     async def process(
         self,
@@ -57,52 +59,72 @@ class AudioPipelineProcessor:
         }
         
         try:
-            # Process each segment
-            for segment_idx, segment_data in enumerate(segments):
-                logger.info(f"Processing segment {segment_idx + 1}/{len(segments)}")
-                
-                # Update job progress
-                segment_progress = (segment_idx / len(segments)) * 100
-                job_manager.update_job_progress(
-                    job_id,
-                    segment_progress,
-                    f"processing_segment_{segment_idx}",
-                    f"Processing segment {segment_idx + 1}/{len(segments)}"
-                )
-                
-                # Mark segment as running
-                job_manager.update_segment_status(
-                    job_id,
-                    segment_idx,
-                    JobStatus.RUNNING
-                )
-                
-                # Process segment through pipeline
-                segment_result = await self._process_segment(
-                    job_id=job_id,
-                    segment_idx=segment_idx,
-                    segment_data=segment_data,
-                    config=config,
-                    swiftf0_wrapper=swiftf0_wrapper,
-                    svc_wrapper=svc_wrapper,
-                    instrumental_wrapper=instrumental_wrapper
-                )
-                
-                results["segments"].append(segment_result)
-                
-                # Update segment status to completed
-                job_manager.update_segment_status(
-                    job_id,
-                    segment_idx,
-                    JobStatus.COMPLETED,
-                    preview_path=segment_result.get("preview_path"),
-                    result_path=segment_result.get("output_path")
-                )
-                
-                # Clear GPU cache if enabled
-                if config.processing.clear_cache_between_segments:
-                    self._clear_gpu_cache()
-            
+            self._exists_cache.clear()
+            self._warmup_allocator(segments, config)
+
+            # Process segments concurrently: the heavy wrapper calls run
+            # in threads, so while one segment sits in DSP another can do
+            # its file I/O and conversion. The semaphore caps in-flight
+            # segments at the configured VRAM-safe limit.
+            semaphore = asyncio.Semaphore(
+                max(1, config.processing.max_concurrent_segments)
+            )
+            completed = 0
+
+            async def run_segment(segment_idx: int, segment_data: Dict) -> Dict:
+                nonlocal completed
+
+                async with semaphore:
+                    logger.info(f"Processing segment {segment_idx + 1}/{len(segments)}")
+
+                    # Mark segment as running
+                    job_manager.update_segment_status(
+                        job_id,
+                        segment_idx,
+                        JobStatus.RUNNING
+                    )
+
+                    # Process segment through pipeline
+                    segment_result = await self._process_segment(
+                        job_id=job_id,
+                        segment_idx=segment_idx,
+                        segment_data=segment_data,
+                        config=config,
+                        swiftf0_wrapper=swiftf0_wrapper,
+                        svc_wrapper=svc_wrapper,
+                        instrumental_wrapper=instrumental_wrapper
+                    )
+
+                    # Update segment status to completed
+                    job_manager.update_segment_status(
+                        job_id,
+                        segment_idx,
+                        JobStatus.COMPLETED,
+                        preview_path=segment_result.get("preview_path"),
+                        result_path=segment_result.get("output_path")
+                    )
+
+                    completed += 1
+                    job_manager.update_job_progress(
+                        job_id,
+                        (completed / len(segments)) * 90,
+                        f"processing_segment_{segment_idx}",
+                        f"Processed segment {completed}/{len(segments)}"
+                    )
+
+                    return segment_result
+
+            results["segments"] = list(await asyncio.gather(*(
+                run_segment(idx, seg) for idx, seg in enumerate(segments)
+            )))
+
+            # Release cached VRAM once per job, not per segment:
+            # empty_cache scans the whole caching allocator and forcing
+            # it between segments just sends the next allocation back
+            # to cudaMalloc and fragments the heap
+            if config.processing.clear_cache_between_segments:
+                self._clear_gpu_cache()
+
             # Combine segments
             job_manager.update_job_progress(
                 job_id,
@@ -167,9 +189,10 @@ class AudioPipelineProcessor:
             "stages": {}
         }
         
-        # Load original segment
+        # Load original segment (stat in a thread: on networked
+        # filesystems even exists() can stall the event loop)
         original_path = segment_data.get("original_path")
-        if not original_path or not Path(original_path).exists():
+        if not original_path or not await self._path_exists(original_path):
             logger.warning(f"No original path for segment {segment_idx}, using placeholder")
             original_path = None
         
@@ -187,7 +210,8 @@ class AudioPipelineProcessor:
                         config.swiftf0,
                         swiftf0_wrapper,
                         job_id,
-                        segment_idx
+                        segment_idx,
+                        segment_data
                     )
                     result["stages"]["swiftf0"] = {"status": "completed", "output": current_audio}
                 
@@ -222,11 +246,12 @@ class AudioPipelineProcessor:
                 # Continue with next stage
         
         # Save final segment output
-        if current_audio and Path(current_audio).exists():
+        if current_audio and await self._path_exists(current_audio):
             segment_output = self.temp_dir / f"{job_id}_segment_{segment_idx}_final.wav"
-            
-            # Convert/copy to desired format
-            self._convert_audio(
+
+            # Convert/copy to desired format (blocking decode/encode)
+            await asyncio.to_thread(
+                self._convert_audio,
                 Path(current_audio),
                 segment_output,
                 config.quality
@@ -237,36 +262,84 @@ class AudioPipelineProcessor:
         
         return result
     
+    async def _path_exists(self, path: Any) -> bool:
+        """
+        Cached existence check, one stat() per path per job
+
+        Args:
+            path: Path to check
+
+        Returns:
+            True if the path exists
+        """
+        key = str(path)
+        cached = self._exists_cache.get(key)
+        if cached is None:
+            cached = await asyncio.to_thread(Path(key).exists)
+            self._exists_cache[key] = cached
+        return cached
+
     async def _process_swiftf0(
         self,
         input_path: Optional[str],
         config: Any,
         wrapper: Any,
         job_id: str,
-        segment_idx: int
+        segment_idx: int,
+        segment_data: Optional[Dict] = None
     ) -> Optional[str]:
         """Process with SwiftF0"""
         if not input_path or not wrapper.is_available():
             logger.warning(f"SwiftF0 not available or no input, skipping")
             return input_path
-        
+
         try:
             # Load model if not loaded
             if not wrapper.is_loaded():
                 wrapper.load()
-            
-            # Process audio
+
             output_path = self.temp_dir / f"{job_id}_segment_{segment_idx}_swiftf0.wav"
-            
-            result = wrapper.process(
+
+            # F0-only runs extract the contour once per source file:
+            # extract_f0_segment memoizes the full-file analysis and
+            # slices it by segment bounds, instead of paying the pyin
+            # HMM build for every segment
+            if config.extract_f0_only and segment_data is not None:
+                start_time = segment_data.get("start_time", 0.0)
+                end_time = segment_data.get(
+                    "end_time", start_time + segment_data.get("duration", 0.0)
+                )
+                f0 = await asyncio.to_thread(
+                    wrapper.extract_f0_segment,
+                    str(input_path),
+                    start_time,
+                    end_time
+                )
+                if f0 is not None:
+                    import numpy as np
+
+                    f0_path = output_path.with_suffix('.f0.txt')
+                    await asyncio.to_thread(np.savetxt, f0_path, f0)
+                    logger.info(f"F0 extracted to {f0_path}")
+                    # F0-only leaves the audio itself untouched
+                    return input_path
+                # Slicing failed; fall through to per-segment extraction
+
+            # Process audio off the event loop: wrapper.process does
+            # blocking decode/DSP/encode, and soundfile/librosa release
+            # the GIL for the heavy parts
+            result = await asyncio.to_thread(
+                wrapper.process,
                 input_path=str(input_path),
                 output_path=str(output_path),
                 pitch_shift=config.pitch_shift,
                 formant_shift=config.formant_shift,
                 extract_f0_only=config.extract_f0_only
             )
-            
+
             if result:
+                # The wrapper just wrote this file; skip a later stat
+                self._exists_cache[str(output_path)] = True
                 return str(output_path)
             return input_path
             
@@ -295,7 +368,8 @@ class AudioPipelineProcessor:
             # Process audio
             output_path = self.temp_dir / f"{job_id}_segment_{segment_idx}_svc.wav"
             
-            result = wrapper.process(
+            result = await asyncio.to_thread(
+                wrapper.process,
                 input_path=str(input_path),
                 output_path=str(output_path),
                 speaker_id=config.speaker_id,
@@ -305,8 +379,9 @@ class AudioPipelineProcessor:
                 cluster_infer_ratio=config.cluster_infer_ratio,
                 noise_scale=config.noise_scale
             )
-            
+
             if result:
+                self._exists_cache[str(output_path)] = True
                 return str(output_path)
             return input_path
             
@@ -335,15 +410,17 @@ class AudioPipelineProcessor:
             # Process audio
             output_path = self.temp_dir / f"{job_id}_segment_{segment_idx}_instrumental.wav"
             
-            result = wrapper.process(
+            result = await asyncio.to_thread(
+                wrapper.process,
                 input_path=str(input_path),
                 output_path=str(output_path),
                 split_vocals=config.split_vocals,
                 stem_separation=config.stem_separation,
                 stems=config.stems
             )
-            
+
             if result:
+                self._exists_cache[str(output_path)] = True
                 return str(output_path)
             return input_path
             
@@ -369,41 +446,111 @@ class AudioPipelineProcessor:
             Path to combined output
         """
         import subprocess
-        import tempfile
-        
+
+        from audio_backend.integrations._device import has_module
+
         # Filter segments that have output
         valid_segments = [s for s in segments if s.get("output_path")]
-        
+
         if not valid_segments:
             raise ValueError("No valid segments to combine")
-        
+
         output_path = self.temp_dir / f"{job_id}_combined.{config.quality.output_format.value}"
-        
-        # Create file list for ffmpeg concatenation
-        concat_list = self.temp_dir / f"{job_id}_concat_list.txt"
-        with open(concat_list, 'w') as f:
-            for segment in valid_segments:
-                f.write(f"file '{Path(segment['output_path']).absolute()}'\n")
-        
+
+        # In-process packet copy via PyAV skips the ffmpeg fork/exec,
+        # the concat-list round-trip through disk and the stderr
+        # capture buffer; segments share codec parameters because they
+        # all come out of _convert_audio
+        if has_module("av"):
+            try:
+                return await asyncio.to_thread(
+                    self._combine_segments_av, valid_segments, output_path
+                )
+            except Exception as e:
+                logger.warning(f"PyAV concat failed, falling back to ffmpeg: {e}")
+
+        # Feed the concat list through stdin instead of a temp file:
+        # no disk round-trip or cleanup, and no shell-style quoting of
+        # paths (the concat demuxer escapes ' as '\'' inside quotes)
+        concat_lines = []
+        for segment in valid_segments:
+            escaped = str(Path(segment["output_path"]).absolute()).replace(
+                "'", "'\\''"
+            )
+            concat_lines.append(f"file '{escaped}'\n")
+        concat_bytes = "".join(concat_lines).encode()
+
         # Use ffmpeg to concatenate
         cmd = [
             "ffmpeg",
+            "-hide_banner", "-loglevel", "error", "-nostats",
             "-y",
             "-f", "concat",
             "-safe", "0",
-            "-i", str(concat_list),
+            "-protocol_whitelist", "pipe,file",
+            "-i", "pipe:0",
             "-c", "copy",
             str(output_path)
         ]
-        
-        subprocess.run(cmd, check=True, capture_output=True)
-        
-        # Clean up concat list
-        if concat_list.exists():
-            concat_list.unlink()
-        
+
+        # Run ffmpeg without blocking the event loop: other jobs' API
+        # requests share this loop with the pipeline. stdout goes to
+        # /dev/null and -loglevel error keeps stderr to actual errors,
+        # so nothing buffers up in the parent however long the concat
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await proc.communicate(concat_bytes)
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(
+                proc.returncode, cmd, stderr=stderr[-4096:]
+            )
+
         return str(output_path)
     
+    @staticmethod
+    def _combine_segments_av(valid_segments: List[Dict], output_path: Path) -> str:
+        """
+        Concatenate segment outputs in-process with PyAV (stream copy)
+
+        Args:
+            valid_segments: Segment results carrying output_path
+            output_path: Combined output path
+
+        Returns:
+            Path to combined output
+        """
+        import av
+
+        with av.open(str(output_path), 'w') as out_container:
+            out_stream = None
+            offset = 0
+
+            for segment in valid_segments:
+                with av.open(segment["output_path"]) as in_container:
+                    in_stream = in_container.streams.audio[0]
+                    if out_stream is None:
+                        out_stream = out_container.add_stream(template=in_stream)
+
+                    last_end = offset
+                    for packet in in_container.demux(in_stream):
+                        if packet.dts is None:
+                            continue
+                        # Shift timestamps so segments play back to back
+                        packet.pts = (packet.pts or 0) + offset
+                        packet.dts = packet.dts + offset
+                        last_end = max(
+                            last_end, packet.dts + (packet.duration or 0)
+                        )
+                        packet.stream = out_stream
+                        out_container.mux(packet)
+                    offset = last_end
+
+        return str(output_path)
+
     def _convert_audio(
         self,
         input_path: Path,
@@ -419,9 +566,32 @@ class AudioPipelineProcessor:
             quality_config: Audio quality configuration
         """
         import subprocess
-        
+
+        from audio_backend.integrations._device import has_module
+
+        # Every pipeline stage writes WAV, so the common case is
+        # WAV-in/WAV-out: libsndfile reads and writes the PCM directly,
+        # skipping demuxer/muxer/encoder setup entirely
+        if (input_path.suffix.lower() == ".wav"
+                and output_path.suffix.lower() == ".wav"):
+            try:
+                self._convert_audio_sf(input_path, output_path, quality_config)
+                return
+            except Exception as e:
+                logger.warning(f"soundfile conversion failed, falling back: {e}")
+
+        # Per-segment ffmpeg spawns pay fork+exec and codec init every
+        # time; the PyAV path decodes/resamples/encodes in-process
+        if has_module("av"):
+            try:
+                self._convert_audio_av(input_path, output_path, quality_config)
+                return
+            except Exception as e:
+                logger.warning(f"PyAV conversion failed, falling back to ffmpeg: {e}")
+
         cmd = [
             "ffmpeg",
+            "-hide_banner", "-loglevel", "error", "-nostats",
             "-y",
             "-i", str(input_path),
             "-ar", str(quality_config.sample_rate),
@@ -429,13 +599,154 @@ class AudioPipelineProcessor:
             "-sample_fmt", "s16" if quality_config.bit_depth == 16 else "s32",
             str(output_path)
         ]
-        
-        subprocess.run(cmd, check=True, capture_output=True)
+
+        # Don't buffer ffmpeg chatter in this process; keep only the
+        # tail of stderr when the conversion actually fails
+        try:
+            subprocess.run(
+                cmd,
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
+            )
+        except subprocess.CalledProcessError as e:
+            e.stderr = e.stderr[-4096:] if e.stderr else e.stderr
+            raise
+
+    @staticmethod
+    def _convert_audio_sf(
+        input_path: Path,
+        output_path: Path,
+        quality_config: Any
+    ):
+        """
+        Convert WAV audio directly through libsndfile
+
+        Args:
+            input_path: Input WAV path
+            output_path: Output WAV path
+            quality_config: Audio quality configuration
+        """
+        import numpy as np
+        import soundfile as sf
+
+        data, sr = sf.read(str(input_path), dtype='float32', always_2d=True)
+
+        if data.shape[1] != quality_config.channels:
+            if quality_config.channels == 1:
+                data = data.mean(axis=1, keepdims=True)
+            else:
+                data = np.repeat(
+                    data, quality_config.channels, axis=1
+                )[:, :quality_config.channels]
+
+        if sr != quality_config.sample_rate:
+            import librosa
+
+            data = librosa.resample(
+                data.T, orig_sr=sr, target_sr=quality_config.sample_rate
+            ).T
+
+        sf.write(
+            str(output_path),
+            data,
+            quality_config.sample_rate,
+            subtype='PCM_16' if quality_config.bit_depth == 16 else 'PCM_32'
+        )
+
+    def _convert_audio_av(
+        self,
+        input_path: Path,
+        output_path: Path,
+        quality_config: Any
+    ):
+        """
+        Convert audio in-process with PyAV
+
+        Args:
+            input_path: Input audio path
+            output_path: Output audio path
+            quality_config: Audio quality configuration
+        """
+        import av
+
+        layout = 'mono' if quality_config.channels == 1 else 'stereo'
+        # One resampler per conversion: the flush below finalizes it
+        # permanently, and the stateful filter graph is not safe to
+        # share between concurrently processed segments anyway.
+        # Construction is cheap next to the decode/encode work.
+        resampler = av.AudioResampler(
+            format='s16' if quality_config.bit_depth == 16 else 's32',
+            layout=layout,
+            rate=quality_config.sample_rate
+        )
+
+        codec = 'pcm_s16le' if quality_config.bit_depth == 16 else 'pcm_s32le'
+
+        with av.open(str(input_path)) as in_container, \
+                av.open(str(output_path), 'w') as out_container:
+            out_stream = out_container.add_stream(
+                codec,
+                rate=quality_config.sample_rate,
+                layout=layout
+            )
+            for frame in in_container.decode(audio=0):
+                for out_frame in resampler.resample(frame):
+                    out_container.mux(out_stream.encode(out_frame))
+            # Flush resampler and encoder
+            for out_frame in resampler.resample(None):
+                out_container.mux(out_stream.encode(out_frame))
+            out_container.mux(out_stream.encode(None))
     
+    def _warmup_allocator(self, segments: List[Dict], config: AudioProcessingConfig):
+        """
+        Pre-size the CUDA caching allocator for the largest segment
+
+        Variable segment lengths fragment the allocator: a long segment
+        after a run of short ones forces the slow cudaMalloc path.
+        Touching a worst-case-sized scratch tensor once up front makes
+        the allocator carve segments big enough for everything after.
+
+        Args:
+            segments: Segment definitions for the job
+            config: Processing configuration
+        """
+        try:
+            import torch
+
+            if not torch.cuda.is_available():
+                return
+
+            max_sec = max(
+                (
+                    seg.get("end_time", 0.0) - seg.get("start_time", 0.0)
+                    or seg.get("duration", 0.0)
+                )
+                for seg in segments
+            )
+            n_samples = int(
+                max_sec
+                * config.quality.sample_rate
+                * config.quality.channels
+            )
+            if n_samples <= self._warmed_samples:
+                return
+
+            scratch = torch.empty(
+                n_samples, device='cuda', dtype=torch.float32
+            )
+            del scratch
+            self._warmed_samples = n_samples
+        except Exception as e:
+            logger.warning(f"CUDA allocator warm-up skipped: {e}")
+
     def _clear_gpu_cache(self):
-        """Clear GPU cache to free memory"""
+        """Clear GPU cache to free memory (teardown only)"""
         try:
+            import torch
+
             if torch.cuda.is_available():
+                torch.cuda.synchronize()
                 torch.cuda.empty_cache()
         except Exception as e:
             logger.warning(f"Failed to clear GPU cache: {e}")
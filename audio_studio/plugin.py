@@ -131,24 +131,35 @@ class AudioStudioPlugin(WAN2GPPlugin):
 
     def start_backend(self):
         """Start the FastAPI backend server"""
+        import os
         import subprocess
-        import threading
 
         try:
-            # Start backend in a separate thread
-            def run_backend():
-                import sys
-                from pathlib import Path
-                
-                backend_script = Path(__file__).parent.parent / "audio_backend" / "main.py"
-                subprocess.Popen(
-                    [sys.executable, str(backend_script)],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
+            if self.backend_process and self.backend_process.poll() is None:
+                return (
+                    "Backend: Running | Frontend: Not accessible",
+                    "Backend server is already running on http://127.0.0.1:8001"
                 )
 
-            thread = threading.Thread(target=run_backend, daemon=True)
-            thread.start()
+            backend_script = Path(__file__).parent.parent / "audio_backend" / "main.py"
+            env = dict(os.environ)
+            # Expandable segments let the caching allocator grow in
+            # place instead of fragmenting on variable-length audio
+            # segments
+            env.setdefault(
+                "PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True"
+            )
+            # Popen doesn't block, so no wrapper thread is needed; the
+            # old PIPE handles were never read and would eventually
+            # fill the kernel buffer and hang the child. Keep the
+            # handle so the server can be terminated later.
+            self.backend_process = subprocess.Popen(
+                [sys.executable, str(backend_script)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+                env=env
+            )
 
             return (
                 "Backend: Starting... | Frontend: Not accessible",
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, Request, UploadFile, File, HTTPException, BackgroundTasks
 from fastapi.responses import FileResponse
 from typing import Optional, List
 from pydantic import BaseModel
+import hashlib
 import os
 import uuid
 import shutil
@@ -13,7 +14,12 @@ from utils.config import Config
 router = APIRouter()
 
 config = Config()
-pipeline = CoverPipeline(config)
+
+
+def get_pipeline(request: Request) -> CoverPipeline:
+    # Single pipeline instance, created once in the server lifespan so
+    # model init happens at startup rather than on the first request
+    return request.app.state.pipeline
 
 class ProcessRequest(BaseModel):
     audio_id: str
@@ -21,7 +27,9 @@ class ProcessRequest(BaseModel):
     instrumental_model: Optional[str] = None
     pitch_shift: int = 0
     use_segments: bool = True
-    segment_length: int = 30
+    # None falls back to the server-wide default, which the plugin can
+    # set through COVERSTUDIO_SEGMENT_LENGTH
+    segment_length: Optional[int] = None
 
 class JobStatus(BaseModel):
     job_id: str
@@ -44,55 +52,97 @@ async def upload_audio(file: UploadFile = File(...)):
             detail=f"File type {file_ext} not supported. Allowed: {', '.join(allowed_extensions)}"
         )
     
-    audio_id = str(uuid.uuid4())
-    upload_dir = config.upload_dir / audio_id
-    upload_dir.mkdir(parents=True, exist_ok=True)
-    
-    file_path = upload_dir / f"original{file_ext}"
-    
+    # The audio_id is the content hash, so it is only known after the
+    # stream finishes: spool to a temp name, then move into place
+    config.upload_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = config.upload_dir / f".upload_{uuid.uuid4().hex}{file_ext}"
+
     try:
-        with file_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        
-        file_size = file_path.stat().st_size
-        
+        # Stream the upload in 1 MiB chunks through the async read API:
+        # copyfileobj on the sync file object blocked the event loop for
+        # the whole transfer and double-buffered every chunk. Hashing on
+        # the fly makes storage content-addressed, so identical clips
+        # map to the same audio_id and are stored once
+        hasher = hashlib.sha256()
+        file_size = 0
+        with tmp_path.open("wb") as buffer:
+            while chunk := await file.read(1 << 20):
+                hasher.update(chunk)
+                buffer.write(chunk)
+                file_size += len(chunk)
+
+        audio_id = hasher.hexdigest()[:32]
+        upload_dir = config.upload_dir / audio_id
+        file_path = upload_dir / f"original{file_ext}"
+
+        if file_path.exists():
+            tmp_path.unlink()
+            message = "File already uploaded, reusing existing copy"
+        else:
+            upload_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.replace(file_path)
+            message = "File uploaded successfully"
+
         return {
             "audio_id": audio_id,
             "filename": file.filename,
             "size": file_size,
             "format": file_ext[1:],
-            "message": "File uploaded successfully"
+            "message": message
         }
     except Exception as e:
-        if upload_dir.exists():
-            shutil.rmtree(upload_dir)
+        if tmp_path.exists():
+            tmp_path.unlink()
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
 @router.get("/models/voice")
-async def list_voice_models():
+async def list_voice_models(pipeline: CoverPipeline = Depends(get_pipeline)):
     return pipeline.list_voice_models()
 
 @router.get("/models/instrumental")
-async def list_instrumental_models():
+async def list_instrumental_models(pipeline: CoverPipeline = Depends(get_pipeline)):
     return pipeline.list_instrumental_models()
 
 @router.post("/process")
-async def process_audio(request: ProcessRequest, background_tasks: BackgroundTasks):
+async def process_audio(
+    request: ProcessRequest,
+    background_tasks: BackgroundTasks,
+    pipeline: CoverPipeline = Depends(get_pipeline)
+):
     job_id = str(uuid.uuid4())
-    
+
     upload_dir = config.upload_dir / request.audio_id
     if not upload_dir.exists():
         raise HTTPException(status_code=404, detail="Audio file not found")
-    
+
+    segment_length = request.segment_length or config.segment_length
+
+    # Same audio + same settings = same output; short-circuit repeat
+    # runs to the already-completed job
+    cache_key = hashlib.sha256(
+        f"{request.audio_id}:{request.voice_model}:{request.instrumental_model}:"
+        f"{request.pitch_shift}:{request.use_segments}:{segment_length}"
+        .encode()
+    ).hexdigest()
+
+    cached_job_id = pipeline.get_cached_result(cache_key)
+    if cached_job_id:
+        return {
+            "job_id": cached_job_id,
+            "status": "completed",
+            "message": "Result served from cache"
+        }
+
     background_tasks.add_task(
         pipeline.process_cover,
         job_id=job_id,
         audio_id=request.audio_id,
+        cache_key=cache_key,
         voice_model=request.voice_model,
         instrumental_model=request.instrumental_model,
         pitch_shift=request.pitch_shift,
         use_segments=request.use_segments,
-        segment_length=request.segment_length
+        segment_length=segment_length
     )
     
     return {
@@ -102,7 +152,7 @@ async def process_audio(request: ProcessRequest, background_tasks: BackgroundTas
     }
 
 @router.get("/status/{job_id}")
-async def get_job_status(job_id: str):
+async def get_job_status(job_id: str, pipeline: CoverPipeline = Depends(get_pipeline)):
     status = pipeline.get_job_status(job_id)
     
     if not status:
@@ -111,7 +161,7 @@ async def get_job_status(job_id: str):
     return status
 
 @router.get("/download/{job_id}")
-async def download_result(job_id: str):
+async def download_result(job_id: str, pipeline: CoverPipeline = Depends(get_pipeline)):
     status = pipeline.get_job_status(job_id)
     
     if not status:
@@ -132,7 +182,7 @@ async def download_result(job_id: str):
     )
 
 @router.delete("/job/{job_id}")
-async def delete_job(job_id: str):
+async def delete_job(job_id: str, pipeline: CoverPipeline = Depends(get_pipeline)):
     success = pipeline.delete_job(job_id)
     
     if not success:
@@ -141,7 +191,7 @@ async def delete_job(job_id: str):
     return {"message": "Job deleted successfully"}
 
 @router.get("/waveform/{audio_id}")
-async def get_waveform_data(audio_id: str):
+async def get_waveform_data(audio_id: str, pipeline: CoverPipeline = Depends(get_pipeline)):
     upload_dir = config.upload_dir / audio_id
     
     if not upload_dir.exists():
@@ -1,7 +1,33 @@
+import math
+
 import numpy as np
 import torch
 from typing import Optional
 
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+if _HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _synth_harmonics(out, two_pi_f_dt):
+        # One fused pass: all four harmonics are evaluated in registers
+        # per sample, instead of four full-length np.sin temporaries.
+        # sin(k*phase) comes from the Chebyshev recurrence
+        # s_{k+1} = 2*cos(phase)*s_k - s_{k-1}, so each sample costs one
+        # sin + one cos instead of four libm sins
+        for i in prange(out.shape[0]):
+            phase = two_pi_f_dt * i
+            s1 = math.sin(phase)
+            c1 = math.cos(phase)
+            s2 = 2.0 * c1 * s1
+            s3 = 2.0 * c1 * s2 - s1
+            s4 = 2.0 * c1 * s3 - s2
+            out[i] = 0.3 * s1 + 0.2 * s2 + 0.15 * s3 + 0.1 * s4
+
+
 class InstrumentalGenerator:
     def __init__(self):
         self.model = None
@@ -38,31 +64,73 @@ class InstrumentalGenerator:
             print(f"[Instrumental] Using prompt: {prompt}")
         
         n_samples = int(duration * sample_rate)
-        
-        time = np.linspace(0, duration, n_samples)
-        
+
         fundamental = 440.0
-        instrumental = (
-            0.3 * np.sin(2 * np.pi * fundamental * time) +
-            0.2 * np.sin(2 * np.pi * fundamental * 2 * time) +
-            0.15 * np.sin(2 * np.pi * fundamental * 3 * time) +
-            0.1 * np.sin(2 * np.pi * fundamental * 4 * time)
-        )
-        
-        instrumental += 0.05 * np.random.randn(n_samples)
+        two_pi_f_dt = 2.0 * np.pi * fundamental / sample_rate
+
+        # Use the device the banner advertises: tensorized sin on CUDA
+        # beats scalar libm by a wide margin on long clips
+        if self.device.type == "cuda":
+            try:
+                instrumental = self._generate_cuda(n_samples, two_pi_f_dt, sample_rate)
+                print(f"[Instrumental] Generated {n_samples} samples at {sample_rate} Hz (CUDA)")
+                return instrumental
+            except Exception as e:
+                print(f"[Instrumental] CUDA synthesis failed, falling back to CPU: {e}")
+
+        instrumental = np.empty(n_samples, dtype=np.float32)
+        if _HAS_NUMBA:
+            _synth_harmonics(instrumental, two_pi_f_dt)
+        else:
+            # Phase from sample index and one scalar step: same math as
+            # the linspace time vector, without its endpoint rounding
+            phase = np.float32(two_pi_f_dt) * np.arange(n_samples, dtype=np.float32)
+            instrumental[:] = (
+                0.3 * np.sin(phase) +
+                0.2 * np.sin(2 * phase) +
+                0.15 * np.sin(3 * phase) +
+                0.1 * np.sin(4 * phase)
+            )
         
-        envelope = np.ones(n_samples)
+        # Fresh generator and buffer per call: this object is a shared
+        # singleton and concurrent jobs would race instance-level state.
+        # PCG64 still emits float32 directly, no legacy global lock
+        noise = np.random.default_rng().standard_normal(n_samples, dtype=np.float32)
+        instrumental += 0.05 * noise
+
+        # Fade in place on the two short edges; the interior of a full
+        # envelope would be all 1.0 anyway
         fade_samples = int(0.1 * sample_rate)
-        envelope[:fade_samples] = np.linspace(0, 1, fade_samples)
-        envelope[-fade_samples:] = np.linspace(1, 0, fade_samples)
-        instrumental *= envelope
+        fade = np.linspace(0, 1, fade_samples, dtype=np.float32)
+        instrumental[:fade_samples] *= fade
+        instrumental[-fade_samples:] *= fade[::-1]
         
-        instrumental = np.clip(instrumental, -1.0, 1.0)
+        np.clip(instrumental, -1.0, 1.0, out=instrumental)
         
         print(f"[Instrumental] Generated {n_samples} samples at {sample_rate} Hz")
         
         return instrumental
     
+    def _generate_cuda(self, n_samples: int, two_pi_f_dt: float, sample_rate: int) -> np.ndarray:
+        phase = torch.arange(n_samples, device=self.device, dtype=torch.float32) * two_pi_f_dt
+        x = (
+            0.3 * torch.sin(phase)
+            + 0.2 * torch.sin(2 * phase)
+            + 0.15 * torch.sin(3 * phase)
+            + 0.1 * torch.sin(4 * phase)
+        )
+        x += 0.05 * torch.randn_like(x)
+
+        fade_samples = int(0.1 * sample_rate)
+        fade = torch.linspace(0, 1, fade_samples, device=self.device, dtype=torch.float32)
+        x[:fade_samples] *= fade
+        x[-fade_samples:] *= fade.flip(0)
+
+        x.clamp_(-1.0, 1.0)
+
+        # Single contiguous D2H copy at the end
+        return x.cpu().numpy()
+
     def generate_heartmula(
         self,
         duration: float,
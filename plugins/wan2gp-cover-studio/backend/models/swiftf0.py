@@ -8,26 +8,109 @@ try:
 except ImportError:
     SCIPY_AVAILABLE = False
 
+try:
+    import onnxruntime as ort
+    _HAS_ORT = True
+except ImportError:
+    _HAS_ORT = False
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+if _HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _boxcar_masked(f0, win):
+        # Running-sum boxcar (mode='nearest') fused with the voiced-mask
+        # multiply: one pass over the curve instead of filter + where +
+        # multiply each touching the full array
+        n = f0.shape[0]
+        half = win // 2
+        out = np.empty(n, dtype=f0.dtype)
+        acc = 0.0
+        for k in range(-half, half + 1):
+            idx = min(max(k, 0), n - 1)
+            acc += f0[idx]
+        out[0] = acc / win if f0[0] > 0 else 0.0
+        for i in range(1, n):
+            acc += f0[min(i + half, n - 1)] - f0[max(i - half - 1, 0)]
+            out[i] = acc / win if f0[i] > 0 else 0.0
+        return out
+
+    @njit(cache=True, fastmath=True)
+    def _interp_unvoiced(f0):
+        # Single forward walk: fill gaps between voiced samples by
+        # linear interpolation, edges by extension
+        n = f0.shape[0]
+        out = np.empty(n, dtype=f0.dtype)
+        last = -1
+        for i in range(n):
+            if f0[i] > 0:
+                if last < 0:
+                    for j in range(i):
+                        out[j] = f0[i]
+                else:
+                    step = (f0[i] - f0[last]) / (i - last)
+                    for j in range(last + 1, i):
+                        out[j] = f0[last] + step * (j - last)
+                out[i] = f0[i]
+                last = i
+        if last < 0:
+            return f0.copy()
+        for j in range(last + 1, n):
+            out[j] = f0[last]
+        return out
+
 class SwiftF0Extractor:
     def __init__(self):
         self.model = None
+        self.onnx_session = None
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         print(f"[SwiftF0] Initialized on device: {self.device}")
-    
+
     def is_loaded(self) -> bool:
         return self.model is not None
-    
+
     def load_model(self, model_path: Optional[str] = None):
+        # Fused/quantized ONNX exports run through ONNX Runtime instead
+        # of the torch path
+        if _HAS_ORT and model_path and str(model_path).endswith(".onnx"):
+            print(f"[SwiftF0] Loading ONNX model from {model_path}...")
+
+            sess_options = ort.SessionOptions()
+            sess_options.graph_optimization_level = (
+                ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            )
+            self.onnx_session = ort.InferenceSession(
+                str(model_path),
+                sess_options,
+                providers=["CUDAExecutionProvider", "CPUExecutionProvider"]
+            )
+            self.model = "onnx"
+
+            print("[SwiftF0] ONNX model loaded successfully")
+            return
+
         print("[SwiftF0] Loading model (placeholder implementation)...")
         self.model = "placeholder"
         print("[SwiftF0] Model loaded successfully")
-    
+
     def extract_pitch(self, audio: np.ndarray, sr: int) -> np.ndarray:
         if not self.is_loaded():
             self.load_model()
-        
+
         print(f"[SwiftF0] Extracting pitch from audio of length {len(audio)} samples at {sr} Hz")
-        
+
+        if self.onnx_session is not None:
+            outputs = self.onnx_session.run(None, {
+                "audio": audio[None, :].astype(np.float32)
+            })
+            f0_curve = outputs[0][0]
+            print(f"[SwiftF0] Extracted F0 curve with {len(f0_curve)} frames (ONNX)")
+            return f0_curve
+
         hop_length = 512
         n_frames = len(audio) // hop_length
         
@@ -45,27 +128,33 @@ class SwiftF0Extractor:
         return f0_curve
     
     def smooth_f0(self, f0_curve: np.ndarray, window_size: int = 5) -> np.ndarray:
+        if _HAS_NUMBA and len(f0_curve) > 0:
+            return _boxcar_masked(f0_curve, window_size)
+
         if not SCIPY_AVAILABLE:
             print("[SwiftF0] Warning: scipy not available, skipping smoothing")
             return f0_curve
-        
+
         voiced_mask = f0_curve > 0
-        
+
         smoothed = uniform_filter1d(f0_curve, size=window_size, mode='nearest')
-        
+
         smoothed = smoothed * voiced_mask
-        
+
         return smoothed
-    
+
     def interpolate_unvoiced(self, f0_curve: np.ndarray) -> np.ndarray:
+        if _HAS_NUMBA:
+            return _interp_unvoiced(f0_curve)
+
         voiced_mask = f0_curve > 0
-        
+
         if not np.any(voiced_mask):
             return f0_curve
-        
+
         voiced_indices = np.where(voiced_mask)[0]
         voiced_values = f0_curve[voiced_mask]
-        
+
         interpolated = np.interp(
             np.arange(len(f0_curve)),
             voiced_indices,
@@ -73,5 +162,5 @@ class SwiftF0Extractor:
             left=voiced_values[0],
             right=voiced_values[-1]
         )
-        
+
         return interpolated
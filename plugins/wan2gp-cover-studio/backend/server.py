@@ -1,10 +1,20 @@
+import asyncio
 import os
 import sys
+import threading
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, JSONResponse
+
+try:
+    from fastapi.responses import ORJSONResponse
+    import orjson  # noqa: F401 - probe only, ORJSONResponse needs it
+    _RESPONSE_CLASS = ORJSONResponse
+except ImportError:
+    _RESPONSE_CLASS = JSONResponse
 import uvicorn
 from typing import Optional, List
 import json
@@ -15,19 +25,56 @@ from api.routes import router as api_router
 from services.pipeline import CoverPipeline
 from utils.config import Config
 
-app = FastAPI(title="Cover Studio API", version="1.0.0")
+config = Config()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the pipeline once at startup so model initialization is off
+    # the first request's critical path, and share the instance through
+    # app.state instead of module-level singletons
+    app.state.pipeline = CoverPipeline(config)
+    # Warm the default voice model in the background so the first
+    # conversion doesn't pay the full load latency; to_thread keeps the
+    # event loop free to serve requests while weights load
+    voice_models = app.state.pipeline.list_voice_models()
+    if voice_models:
+        default = voice_models[0]
+        warmup = asyncio.create_task(asyncio.to_thread(
+            app.state.pipeline.svc.load_model, default["path"], default["type"]
+        ))
+        warmup.add_done_callback(lambda t: t.exception())
+    yield
+
+
+_IS_PROD = os.environ.get("ENV", "").lower() in ("prod", "production")
 
+# orjson serializes the status/waveform payloads several times faster
+# than stdlib json; the default applies to every included route. The
+# OpenAPI schema and docs endpoints are dev-only — in prod they just
+# add schema-generation work at startup
+app = FastAPI(
+    title="Cover Studio API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=_RESPONSE_CLASS,
+    docs_url=None if _IS_PROD else "/docs",
+    redoc_url=None if _IS_PROD else "/redoc",
+    openapi_url=None if _IS_PROD else "/openapi.json"
+)
+
+# A wildcard origin combined with credentials is invalid per the CORS
+# spec and browsers reject it; credentials are only enabled when an
+# explicit origin list is configured
+_cors_origins = [o for o in os.environ.get("CORS_ORIGINS", "").split(",") if o]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=_cors_origins or ["*"],
+    allow_credentials=bool(_cors_origins),
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-config = Config()
-pipeline = CoverPipeline(config)
-
 frontend_dir = Path(__file__).parent.parent / "frontend" / "build"
 if frontend_dir.exists():
     app.mount("/static", StaticFiles(directory=str(frontend_dir / "static")), name="static")
@@ -58,7 +105,7 @@ async def health_check():
     return {
         "status": "healthy",
         "pipeline": "initialized",
-        "models_loaded": pipeline.get_loaded_models()
+        "models_loaded": app.state.pipeline.get_loaded_models()
     }
 
 @app.get("/{full_path:path}")
@@ -71,6 +118,23 @@ async def serve_frontend(full_path: str):
     return {"error": "Frontend not built"}
 
 if __name__ == "__main__":
+    # Lifeline from the plugin: EOF on this fd means the parent is gone
+    # (exit, crash or GC) and the server should go with it
+    _parent_fd = os.environ.get("COVERSTUDIO_PARENT_FD")
+    if _parent_fd is not None:
+        def _watch_parent(fd=int(_parent_fd)):
+            while True:
+                try:
+                    data = os.read(fd, 1)
+                except OSError:
+                    # The inherited number isn't a usable fd in this
+                    # process; run without a lifeline rather than die
+                    # on a bad descriptor
+                    return
+                if data == b"":
+                    os._exit(0)
+        threading.Thread(target=_watch_parent, daemon=True).start()
+
     port = int(os.environ.get("PORT", 8765))
     print(f"Starting Cover Studio server on port {port}...")
     print(f"Frontend directory: {frontend_dir}")
@@ -1,8 +1,12 @@
+import base64
 import os
 import json
+import sqlite3
+import time
 import numpy as np
 import soundfile as sf
 import librosa
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -11,14 +15,33 @@ import traceback
 from models.swiftf0 import SwiftF0Extractor
 from models.svc_wrapper import SVCWrapper
 from models.instrumental import InstrumentalGenerator
-from utils.audio import AudioProcessor
+from utils.audio import AudioProcessor, fast_load
 from utils.config import Config
 
 class CoverPipeline:
     def __init__(self, config: Config):
         self.config = config
-        self.jobs: Dict[str, Dict[str, Any]] = {}
-        
+        # Job state lives in an in-memory SQLite table: background
+        # threads update it and HTTP handlers poll it, and sqlite gives
+        # per-statement synchronization the bare dict never had
+        self._db = sqlite3.connect(":memory:", check_same_thread=False)
+        self._db.execute("PRAGMA synchronous=OFF")
+        self._db.execute("PRAGMA journal_mode=MEMORY")
+        self._db.execute(
+            "CREATE TABLE jobs("
+            "id TEXT PRIMARY KEY, status TEXT, progress REAL, "
+            "message TEXT, result_path TEXT, extra TEXT, ts REAL)"
+        )
+        # cache_key -> job_id of a completed run with the same audio
+        # content and settings
+        self.result_cache: Dict[str, str] = {}
+        # Single worker that runs instrumental synthesis (GPU) while
+        # voice conversion runs on the CPU
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        # kind -> (dir mtime_ns, model list); the frontend polls the
+        # model endpoints, no need to re-scan an unchanged directory
+        self._model_list_cache: Dict[str, Any] = {}
+
         self.swiftf0 = SwiftF0Extractor()
         self.svc = SVCWrapper()
         self.instrumental = InstrumentalGenerator()
@@ -35,9 +58,14 @@ class CoverPipeline:
     
     def list_voice_models(self) -> List[Dict[str, str]]:
         models_dir = self.config.models_dir / "voice"
+        mtime = models_dir.stat().st_mtime_ns if models_dir.exists() else -1
+        cached = self._model_list_cache.get("voice")
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
         models = []
-        
-        if models_dir.exists():
+
+        if mtime >= 0:
             for model_path in models_dir.iterdir():
                 if model_path.is_dir() or model_path.suffix in [".pth", ".ckpt"]:
                     models.append({
@@ -54,14 +82,20 @@ class CoverPipeline:
                 "type": "so-vits-svc",
                 "path": "placeholder"
             })
-        
+
+        self._model_list_cache["voice"] = (mtime, models)
         return models
     
     def list_instrumental_models(self) -> List[Dict[str, str]]:
         models_dir = self.config.models_dir / "instrumental"
+        mtime = models_dir.stat().st_mtime_ns if models_dir.exists() else -1
+        cached = self._model_list_cache.get("instrumental")
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
         models = []
-        
-        if models_dir.exists():
+
+        if mtime >= 0:
             for model_path in models_dir.iterdir():
                 if model_path.is_dir() or model_path.suffix in [".pth", ".ckpt"]:
                     models.append({
@@ -78,7 +112,8 @@ class CoverPipeline:
                 "type": "none",
                 "path": ""
             })
-        
+
+        self._model_list_cache["instrumental"] = (mtime, models)
         return models
     
     def _detect_model_type(self, model_path: Path) -> str:
@@ -90,19 +125,71 @@ class CoverPipeline:
         else:
             return "so-vits-svc"
     
+    def _put_job(self, job_id: str, job: Dict[str, Any]):
+        extra = {
+            k: v for k, v in job.items()
+            if k not in ("status", "progress", "message", "result_path")
+        }
+        self._db.execute(
+            "INSERT INTO jobs(id, status, progress, message, result_path, extra, ts) "
+            "VALUES(?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET "
+            "status=excluded.status, progress=excluded.progress, "
+            "message=excluded.message, result_path=excluded.result_path, "
+            "extra=excluded.extra, ts=excluded.ts",
+            (
+                job_id,
+                job.get("status"),
+                job.get("progress", 0.0),
+                job.get("message", ""),
+                job.get("result_path"),
+                json.dumps(extra) if extra else None,
+                time.time()
+            )
+        )
+
     def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
-        return self.jobs.get(job_id)
-    
+        row = self._db.execute(
+            "SELECT status, progress, message, result_path, extra "
+            "FROM jobs WHERE id=?",
+            (job_id,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        job = json.loads(row[4]) if row[4] else {}
+        job["status"] = row[0]
+        job["progress"] = row[1]
+        job["message"] = row[2]
+        if row[3]:
+            job["result_path"] = row[3]
+        return job
+
+    def get_cached_result(self, cache_key: str) -> Optional[str]:
+        job_id = self.result_cache.get(cache_key)
+        if job_id:
+            job = self.get_job_status(job_id)
+            if job and job.get("status") == "completed":
+                result_path = job.get("result_path")
+                if result_path and Path(result_path).exists():
+                    return job_id
+            del self.result_cache[cache_key]
+        return None
+
     def delete_job(self, job_id: str) -> bool:
-        if job_id in self.jobs:
-            job = self.jobs[job_id]
-            if "result_path" in job:
-                result_path = Path(job["result_path"])
-                if result_path.exists():
-                    result_path.unlink()
-            del self.jobs[job_id]
-            return True
-        return False
+        job = self.get_job_status(job_id)
+        if job is None:
+            return False
+
+        if "result_path" in job:
+            result_path = Path(job["result_path"])
+            if result_path.exists():
+                result_path.unlink()
+        self._db.execute("DELETE FROM jobs WHERE id=?", (job_id,))
+        self.result_cache = {
+            k: v for k, v in self.result_cache.items() if v != job_id
+        }
+        return True
     
     def process_cover(
         self,
@@ -112,14 +199,15 @@ class CoverPipeline:
         instrumental_model: Optional[str] = None,
         pitch_shift: int = 0,
         use_segments: bool = True,
-        segment_length: int = 30
+        segment_length: int = 30,
+        cache_key: Optional[str] = None
     ):
-        self.jobs[job_id] = {
+        self._put_job(job_id, {
             "status": "processing",
             "progress": 0.0,
             "message": "Starting pipeline...",
             "started_at": datetime.now().isoformat()
-        }
+        })
         
         try:
             upload_dir = self.config.upload_dir / audio_id
@@ -131,37 +219,58 @@ class CoverPipeline:
             audio_path = audio_files[0]
             
             self._update_job(job_id, 0.05, "Loading audio file...")
-            audio, sr = librosa.load(str(audio_path), sr=None)
+            audio, sr = fast_load(audio_path)
             
             self._update_job(job_id, 0.1, "Separating vocals and instrumental...")
             vocals, instrumental = self.audio_processor.separate_vocals(audio, sr)
             
             self._update_job(job_id, 0.2, "Extracting pitch with SwiftF0...")
             f0_curve = self.swiftf0.extract_pitch(vocals, sr)
-            
+
+            # Conversion preserves sample count, so the instrumental's
+            # duration is known now — synthesize it in the background
+            # while the conversion below occupies the main thread
+            instrumental_future = None
+            if instrumental_model and instrumental_model != "none":
+                instrumental_future = self._executor.submit(
+                    self.instrumental.generate,
+                    duration=len(vocals) / sr,
+                    model=instrumental_model
+                )
+
             if use_segments:
                 self._update_job(job_id, 0.3, "Segmenting audio...")
                 segments = self._create_segments(vocals, sr, segment_length)
                 
                 self._update_job(job_id, 0.4, f"Processing {len(segments)} segments...")
-                processed_segments = []
-                
+
+                # Stack the segments into one (B, T) batch and convert
+                # in a single call; only the final segment needs padding
+                # since chunking is uniform
+                lengths = [len(segment["audio"]) for segment in segments]
+                batch = np.zeros((len(segments), max(lengths)), dtype=np.float32)
                 for i, segment in enumerate(segments):
-                    progress = 0.4 + (i / len(segments)) * 0.3
-                    self._update_job(job_id, progress, f"Processing segment {i+1}/{len(segments)}...")
-                    
-                    segment_f0 = f0_curve[segment["start_frame"]:segment["end_frame"]]
-                    processed = self.svc.convert_voice(
-                        segment["audio"],
-                        sr,
-                        voice_model,
-                        segment_f0,
-                        pitch_shift
-                    )
-                    processed_segments.append(processed)
-                
+                    batch[i, :lengths[i]] = segment["audio"]
+
+                f0_batch = [
+                    f0_curve[segment["start_frame"]:segment["end_frame"]]
+                    for segment in segments
+                ]
+
+                processed_segments = self.svc.convert_voice_batched(
+                    batch,
+                    lengths,
+                    sr,
+                    voice_model,
+                    f0_batch,
+                    pitch_shift
+                )
+
                 self._update_job(job_id, 0.7, "Merging segments...")
-                vocals_converted = np.concatenate(processed_segments)
+                # Keep the per-segment views; the mix stage streams
+                # them straight to disk instead of concatenating a
+                # full-length copy first
+                vocal_blocks = processed_segments
             else:
                 self._update_job(job_id, 0.4, "Converting voice...")
                 vocals_converted = self.svc.convert_voice(
@@ -171,49 +280,97 @@ class CoverPipeline:
                     f0_curve,
                     pitch_shift
                 )
-            
-            if instrumental_model and instrumental_model != "none":
+                vocal_blocks = [vocals_converted]
+
+            if instrumental_future is not None:
                 self._update_job(job_id, 0.8, "Generating instrumental...")
-                instrumental = self.instrumental.generate(
-                    duration=len(vocals_converted) / sr,
-                    model=instrumental_model
-                )
-            
+                instrumental = instrumental_future.result()
+
             self._update_job(job_id, 0.9, "Mixing final output...")
-            final_audio = self.audio_processor.mix_audio(vocals_converted, instrumental, sr)
-            
+
             output_dir = self.config.output_dir / job_id
             output_dir.mkdir(parents=True, exist_ok=True)
             output_path = output_dir / "cover.wav"
+
+            self._write_mixed(output_path, vocal_blocks, instrumental, sr)
             
-            sf.write(str(output_path), final_audio, sr)
-            
-            self.jobs[job_id] = {
+            self._put_job(job_id, {
                 "status": "completed",
                 "progress": 1.0,
                 "message": "Processing completed successfully",
                 "result_path": str(output_path),
                 "completed_at": datetime.now().isoformat()
-            }
+            })
+
+            if cache_key:
+                self.result_cache[cache_key] = job_id
             
         except Exception as e:
             error_msg = f"Error: {str(e)}"
             print(f"[Pipeline] Job {job_id} failed: {error_msg}")
             traceback.print_exc()
             
-            self.jobs[job_id] = {
+            self._put_job(job_id, {
                 "status": "failed",
                 "progress": 0.0,
                 "message": error_msg,
                 "error": str(e),
                 "failed_at": datetime.now().isoformat()
-            }
+            })
     
+    def _write_mixed(
+        self,
+        output_path: Path,
+        vocal_blocks: List[np.ndarray],
+        instrumental: np.ndarray,
+        sr: int,
+        vocal_volume: float = 1.0,
+        instrumental_volume: float = 0.8
+    ):
+        # Stream the mix to disk block by block: peak RAM stays at one
+        # block instead of merged vocals + mix + encoder copies. Two
+        # passes over the blocks — one for the global peak so limiting
+        # matches the in-memory mixer, one for the scaled write.
+        peak = 0.0
+        for block in self._iter_mix_blocks(
+            vocal_blocks, instrumental, vocal_volume, instrumental_volume
+        ):
+            if len(block):
+                peak = max(peak, float(np.abs(block).max()))
+
+        scale = 0.99 / peak if peak > 0.99 else 1.0
+
+        with sf.SoundFile(
+            str(output_path), 'w', samplerate=sr, channels=1, subtype='PCM_16'
+        ) as writer:
+            for block in self._iter_mix_blocks(
+                vocal_blocks, instrumental, vocal_volume, instrumental_volume
+            ):
+                if scale != 1.0:
+                    block = block * scale
+                writer.write(block)
+
+        print(f"[Pipeline] Streamed mixed output to {output_path}")
+
+    @staticmethod
+    def _iter_mix_blocks(vocal_blocks, instrumental, vocal_volume, instrumental_volume):
+        pos = 0
+        for block in vocal_blocks:
+            mixed = block * vocal_volume
+            end = min(pos + len(block), len(instrumental))
+            if end > pos:
+                mixed[:end - pos] += instrumental[pos:end] * instrumental_volume
+            yield mixed
+            pos += len(block)
+        if pos < len(instrumental):
+            yield instrumental[pos:] * instrumental_volume
+
     def _update_job(self, job_id: str, progress: float, message: str):
-        if job_id in self.jobs:
-            self.jobs[job_id]["progress"] = progress
-            self.jobs[job_id]["message"] = message
-            print(f"[Pipeline] Job {job_id}: {progress:.1%} - {message}")
+        self._db.execute(
+            "UPDATE jobs SET progress=?, message=?, ts=? WHERE id=?",
+            (progress, message, time.time(), job_id)
+        )
+        print(f"[Pipeline] Job {job_id}: {progress:.1%} - {message}")
     
     def _create_segments(
         self,
@@ -221,22 +378,26 @@ class CoverPipeline:
         sr: int,
         segment_length: int
     ) -> List[Dict[str, Any]]:
+        # hop must match SwiftF0's frame hop so the per-segment
+        # start_frame/end_frame index the F0 curve, not raw samples
+        hop = 512
         segment_samples = segment_length * sr
         total_samples = len(audio)
+
+        starts = np.arange(0, total_samples, segment_samples)
+        ends = np.minimum(starts + segment_samples, total_samples)
+
         segments = []
-        
-        for start_sample in range(0, total_samples, segment_samples):
-            end_sample = min(start_sample + segment_samples, total_samples)
-            
+        for start_sample, end_sample in zip(starts.tolist(), ends.tolist()):
             segments.append({
                 "audio": audio[start_sample:end_sample],
                 "start_sample": start_sample,
                 "end_sample": end_sample,
-                "start_frame": start_sample,
-                "end_frame": end_sample,
+                "start_frame": start_sample // hop,
+                "end_frame": end_sample // hop,
                 "duration": (end_sample - start_sample) / sr
             })
-        
+
         return segments
     
     def generate_waveform_data(self, audio_id: str) -> Dict[str, Any]:
@@ -247,13 +408,21 @@ class CoverPipeline:
             raise FileNotFoundError("Audio file not found")
         
         audio_path = audio_files[0]
-        audio, sr = librosa.load(str(audio_path), sr=22050, mono=True)
-        
-        downsample_factor = 100
-        downsampled = audio[::downsample_factor]
+        audio, sr = fast_load(audio_path, target_sr=22050)
         
+        # Per-bucket min/max peaks instead of naive stride-100 picking:
+        # no aliasing in the rendered waveform, and the fp16 bytes over
+        # base64 skip boxing every sample into a Python float for JSON
+        bucket = 100
+        usable = (len(audio) // bucket) * bucket
+        buckets = audio[:usable].reshape(-1, bucket)
+        peaks = np.stack(
+            [buckets.max(axis=1), buckets.min(axis=1)], axis=-1
+        ).astype(np.float16)
+
         return {
-            "samples": downsampled.tolist(),
+            "peaks_b64": base64.b64encode(peaks.tobytes()).decode(),
+            "bucket": bucket,
             "sample_rate": sr,
             "duration": len(audio) / sr,
             "channels": 1
@@ -0,0 +1,64 @@
+"""
+Offline ONNX export for SVC / SwiftF0 checkpoints.
+
+Exports a torch model to ONNX with dynamic axes, then applies dynamic
+int8 weight quantization so the runtime session (see SVCWrapper /
+SwiftF0Extractor) can use the fused, quantized graph.
+
+Usage:
+    python tools/export_svc_onnx.py checkpoint.pt model.onnx --sr 44100
+"""
+import argparse
+from pathlib import Path
+
+import torch
+
+
+def export(checkpoint: Path, output: Path, sample_rate: int, seconds: float):
+    print(f"[Export] Loading checkpoint from {checkpoint}...")
+    model = torch.jit.load(str(checkpoint)) if checkpoint.suffix == ".ts" \
+        else torch.load(str(checkpoint), map_location="cpu", mmap=True)
+    model.eval()
+
+    n_samples = int(seconds * sample_rate)
+    n_frames = n_samples // 512
+    dummy_audio = torch.zeros(1, n_samples)
+    dummy_f0 = torch.zeros(1, n_frames)
+
+    print(f"[Export] Exporting to {output}...")
+    torch.onnx.export(
+        model,
+        (dummy_audio, dummy_f0),
+        str(output),
+        input_names=["audio", "f0"],
+        output_names=["converted"],
+        dynamic_axes={
+            "audio": {0: "batch", 1: "samples"},
+            "f0": {0: "batch", 1: "frames"},
+            "converted": {0: "batch", 1: "samples"}
+        },
+        opset_version=17
+    )
+
+    print("[Export] Quantizing weights to int8...")
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantized = output.with_suffix(".int8.onnx")
+    quantize_dynamic(str(output), str(quantized), weight_type=QuantType.QInt8)
+
+    print(f"[Export] Done: {output} (fp32), {quantized} (int8)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export SVC/SwiftF0 model to ONNX")
+    parser.add_argument("checkpoint", type=Path, help="Torch checkpoint (.pt or .ts)")
+    parser.add_argument("output", type=Path, help="Output .onnx path")
+    parser.add_argument("--sr", type=int, default=44100, help="Sample rate for dummy input")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Dummy input duration")
+    args = parser.parse_args()
+
+    export(args.checkpoint, args.output, args.sr, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,193 @@
+import os
+from collections import OrderedDict
+from typing import Tuple
+
 import numpy as np
 import librosa
-from typing import Tuple
 import soundfile as sf
+import torch
+
+try:
+    import torchaudio
+    _HAS_TORCHAUDIO = True
+except ImportError:
+    _HAS_TORCHAUDIO = False
+
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+if _HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _hpss_medians(mag, win):
+        # Both HPSS median filters in one prange over time frames:
+        # harmonic = median along time, percussive = median along
+        # frequency, each column touched once per thread
+        n_freq, n_frames = mag.shape
+        half = win // 2
+        harmonic = np.empty_like(mag)
+        percussive = np.empty_like(mag)
+        for t in prange(n_frames):
+            buf = np.empty(win, dtype=mag.dtype)
+            for f in range(n_freq):
+                for k in range(win):
+                    tt = min(max(t - half + k, 0), n_frames - 1)
+                    buf[k] = mag[f, tt]
+                harmonic[f, t] = np.median(buf)
+                for k in range(win):
+                    ff = min(max(f - half + k, 0), n_freq - 1)
+                    buf[k] = mag[ff, t]
+                percussive[f, t] = np.median(buf)
+        return harmonic, percussive
+
+    @njit(cache=True, fastmath=True)
+    def _mix_and_limit(vocals, instrumental, vocal_volume, instrumental_volume):
+        # Mix and track the running peak in one pass, rescale in a
+        # second only when limiting is needed — instead of separate
+        # multiply, add, abs, max and divide passes over the array
+        n = vocals.shape[0]
+        out = np.empty(n, dtype=vocals.dtype)
+        peak = 0.0
+        for i in range(n):
+            v = vocals[i] * vocal_volume + instrumental[i] * instrumental_volume
+            out[i] = v
+            a = abs(v)
+            if a > peak:
+                peak = a
+        if peak > 0.99:
+            scale = 0.99 / peak
+            for i in range(n):
+                out[i] *= scale
+        return out
+
+    @njit(cache=True, fastmath=True)
+    def _normalize_clip(audio, target_rms):
+        # Fused rms + scale + clip: one reduction pass, one write pass
+        n = audio.shape[0]
+        acc = 0.0
+        for i in range(n):
+            acc += audio[i] * audio[i]
+        rms = (acc / n) ** 0.5
+        out = np.empty(n, dtype=audio.dtype)
+        scale = target_rms / rms if rms > 0 else 1.0
+        for i in range(n):
+            v = audio[i] * scale
+            if v > 1.0:
+                v = 1.0
+            elif v < -1.0:
+                v = -1.0
+            out[i] = v
+        return out
+
+
+def _fit_length(x: np.ndarray, target_len: int) -> np.ndarray:
+    # Pad with a single zeros allocation + copyto (np.pad builds the
+    # output through extra temporaries), or truncate via a view
+    if len(x) == target_len:
+        return x
+    if len(x) > target_len:
+        return x[:target_len]
+    out = np.zeros(target_len, dtype=x.dtype)
+    np.copyto(out[:len(x)], x)
+    return out
+
+
+# Decoded waveforms keyed by (path, mtime_ns, target_sr), bounded by
+# total bytes; interactive clients hit the same original.* repeatedly.
+# The budget is the plugin-controlled audio buffer pool size
+_decode_cache: "OrderedDict[Tuple[str, int, int], Tuple[np.ndarray, int]]" = OrderedDict()
+_decode_cache_bytes = 0
+_DECODE_CACHE_MAX_BYTES = (
+    int(os.environ.get("COVERSTUDIO_AUDIO_POOL_MB", 512)) * 1024 * 1024
+)
+
+
+def fast_load(path, target_sr: int = None) -> Tuple[np.ndarray, int]:
+    global _decode_cache_bytes
+
+    key = (str(path), os.stat(str(path)).st_mtime_ns, target_sr or 0)
+    cached = _decode_cache.get(key)
+    if cached is not None:
+        _decode_cache.move_to_end(key)
+        return cached
+
+    audio, sr = _decode(path, target_sr)
+
+    # Hand out one shared read-only array instead of re-decoding
+    audio.setflags(write=False)
+    _decode_cache[key] = (audio, sr)
+    _decode_cache_bytes += audio.nbytes
+    while _decode_cache_bytes > _DECODE_CACHE_MAX_BYTES and _decode_cache:
+        _, (evicted, _) = _decode_cache.popitem(last=False)
+        _decode_cache_bytes -= evicted.nbytes
+
+    return audio, sr
+
+
+def _decode(path, target_sr: int = None) -> Tuple[np.ndarray, int]:
+    # libsndfile decodes WAV/FLAC/OGG straight into float32 without the
+    # audioread/resample copies librosa.load makes; torchaudio covers
+    # the compressed formats libsndfile can't
+    suffix = str(path).rsplit('.', 1)[-1].lower()
+
+    if suffix in ('wav', 'flac', 'ogg'):
+        audio, sr = sf.read(str(path), dtype='float32', always_2d=False)
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1)
+    elif _HAS_TORCHAUDIO:
+        wave, sr = torchaudio.load(str(path))
+        audio = wave.mean(dim=0).numpy()
+    else:
+        audio, sr = librosa.load(str(path), sr=None, mono=True)
+
+    if target_sr and sr != target_sr:
+        if _HAS_TORCHAUDIO and torch.cuda.is_available():
+            wave = torch.from_numpy(audio).cuda()
+            audio = torchaudio.functional.resample(
+                wave, sr, target_sr, lowpass_filter_width=16
+            ).cpu().numpy()
+        else:
+            audio = librosa.resample(audio, orig_sr=sr, target_sr=target_sr)
+        sr = target_sr
+
+    return audio, sr
+
 
 class AudioProcessor:
     def __init__(self):
-        print("[AudioProcessor] Initialized")
-    
+        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        self._stft = None
+        self._istft = None
+        self._pinned = None
+        print(f"[AudioProcessor] Initialized on device: {self.device}")
+
     def separate_vocals(self, audio: np.ndarray, sr: int) -> Tuple[np.ndarray, np.ndarray]:
         print(f"[AudioProcessor] Separating vocals from audio of length {len(audio)} samples")
-        
+
+        # HPSS on the GPU: cuFFT spectrograms plus median filtering as
+        # batched tensor ops, instead of librosa's frame-by-frame CPU FFTs
+        if _HAS_TORCHAUDIO and self.device.type == "cuda":
+            try:
+                return self._separate_vocals_gpu(audio)
+            except Exception as e:
+                print(f"[AudioProcessor] GPU separation failed, falling back to CPU: {e}")
+
         stft = librosa.stft(audio)
         
         magnitude = np.abs(stft)
         phase = np.angle(stft)
-        
-        harmonic_mag, percussive_mag = librosa.decompose.hpss(magnitude)
+
+        if _HAS_NUMBA:
+            # Parallel median filters + soft Wiener masks, matching the
+            # GPU path; librosa's hpss median-filters single-threaded
+            harmonic, percussive = _hpss_medians(magnitude, 31)
+            total = harmonic ** 2 + percussive ** 2 + 1e-8
+            harmonic_mag = magnitude * (harmonic ** 2 / total)
+            percussive_mag = magnitude * (percussive ** 2 / total)
+        else:
+            harmonic_mag, percussive_mag = librosa.decompose.hpss(magnitude)
         
         vocals_stft = harmonic_mag * np.exp(1j * phase)
         instrumental_stft = percussive_mag * np.exp(1j * phase)
@@ -24,20 +196,68 @@ class AudioProcessor:
         instrumental = librosa.istft(instrumental_stft)
         
         target_length = len(audio)
-        if len(vocals) < target_length:
-            vocals = np.pad(vocals, (0, target_length - len(vocals)))
-        else:
-            vocals = vocals[:target_length]
-        
-        if len(instrumental) < target_length:
-            instrumental = np.pad(instrumental, (0, target_length - len(instrumental)))
-        else:
-            instrumental = instrumental[:target_length]
+        vocals = _fit_length(vocals, target_length)
+        instrumental = _fit_length(instrumental, target_length)
         
         print(f"[AudioProcessor] Separated vocals: {len(vocals)} samples, instrumental: {len(instrumental)} samples")
-        
+
         return vocals, instrumental
-    
+
+    def _separate_vocals_gpu(self, audio: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        if self._stft is None:
+            self._stft = torchaudio.transforms.Spectrogram(
+                n_fft=2048, hop_length=512, power=None
+            ).to(self.device)
+            self._istft = torchaudio.transforms.InverseSpectrogram(
+                n_fft=2048, hop_length=512
+            ).to(self.device)
+
+        # Stage through a reusable pinned buffer: the H2D copy from
+        # pageable numpy memory would otherwise serialize on the default
+        # stream, pinned + non_blocking lets it run async
+        n = len(audio)
+        if self._pinned is None or self._pinned.shape[0] < n:
+            self._pinned = torch.empty(n, dtype=torch.float32, pin_memory=True)
+        staging = self._pinned[:n]
+        staging.copy_(
+            torch.from_numpy(np.ascontiguousarray(audio, dtype=np.float32))
+        )
+        wave = staging.to(self.device, non_blocking=True)
+
+        spec = self._stft(wave)
+        mag = spec.abs()
+
+        harmonic = self._median_filter(mag, 31, dim=1)
+        percussive = self._median_filter(mag, 31, dim=0)
+
+        # Soft Wiener masks applied to the complex spectrogram keep the
+        # original phase without ever materializing angle/exp arrays
+        total = harmonic + percussive + 1e-8
+        mask_h = harmonic / total
+        mask_p = percussive / total
+
+        length = wave.shape[-1]
+        vocals = self._istft(spec * mask_h, length)
+        instrumental = self._istft(spec * mask_p, length)
+
+        print(f"[AudioProcessor] Separated vocals on GPU: {length} samples")
+
+        return vocals.cpu().numpy(), instrumental.cpu().numpy()
+
+    @staticmethod
+    def _median_filter(mag: torch.Tensor, kernel_size: int, dim: int) -> torch.Tensor:
+        # Separable 1-D median along time (dim=1) or frequency (dim=0)
+        pad = kernel_size // 2
+        if dim == 1:
+            padded = torch.nn.functional.pad(
+                mag.unsqueeze(0), (pad, pad), mode='replicate'
+            ).squeeze(0)
+        else:
+            padded = torch.nn.functional.pad(
+                mag.t().unsqueeze(0), (pad, pad), mode='replicate'
+            ).squeeze(0).t()
+        return padded.unfold(dim, kernel_size, 1).median(dim=-1).values
+
     def mix_audio(
         self,
         vocals: np.ndarray,
@@ -50,16 +270,19 @@ class AudioProcessor:
         
         max_length = max(len(vocals), len(instrumental))
         
-        if len(vocals) < max_length:
-            vocals = np.pad(vocals, (0, max_length - len(vocals)))
-        if len(instrumental) < max_length:
-            instrumental = np.pad(instrumental, (0, max_length - len(instrumental)))
-        
-        mixed = vocals * vocal_volume + instrumental * instrumental_volume
-        
-        max_amplitude = np.abs(mixed).max()
-        if max_amplitude > 0.99:
-            mixed = mixed / max_amplitude * 0.99
+        vocals = _fit_length(vocals, max_length)
+        instrumental = _fit_length(instrumental, max_length)
+
+        if _HAS_NUMBA:
+            mixed = _mix_and_limit(
+                vocals, instrumental, vocal_volume, instrumental_volume
+            )
+        else:
+            mixed = vocals * vocal_volume + instrumental * instrumental_volume
+
+            max_amplitude = np.abs(mixed).max()
+            if max_amplitude > 0.99:
+                mixed = mixed / max_amplitude * 0.99
         
         print(f"[AudioProcessor] Mixed audio length: {len(mixed)} samples")
         
@@ -67,16 +290,20 @@ class AudioProcessor:
     
     def normalize_audio(self, audio: np.ndarray, target_level: float = -20.0) -> np.ndarray:
         print("[AudioProcessor] Normalizing audio")
-        
+
+        target_rms = 10 ** (target_level / 20)
+
+        if _HAS_NUMBA and len(audio) > 0:
+            return _normalize_clip(audio, target_rms)
+
         rms = np.sqrt(np.mean(audio ** 2))
-        
+
         if rms > 0:
-            target_rms = 10 ** (target_level / 20)
             scaling_factor = target_rms / rms
             audio = audio * scaling_factor
-        
+
         audio = np.clip(audio, -1.0, 1.0)
-        
+
         return audio
     
     def apply_fade(
@@ -120,14 +347,24 @@ class AudioProcessor:
         hop_length: int = 512
     ) -> np.ndarray:
         print("[AudioProcessor] Trimming silence")
-        
-        trimmed, _ = librosa.effects.trim(
-            audio,
-            top_db=top_db,
-            frame_length=frame_length,
-            hop_length=hop_length
-        )
-        
+
+        # Vectorized peak envelope per hop instead of librosa's framed
+        # RMS loop: one reshape/max pass and two argmax scans
+        usable = (len(audio) // hop_length) * hop_length
+        if usable == 0:
+            return audio
+
+        env = np.abs(audio[:usable]).reshape(-1, hop_length).max(axis=1)
+        threshold = env.max() * 10 ** (-top_db / 20)
+        mask = env > threshold
+
+        if not mask.any():
+            trimmed = audio[:0]
+        else:
+            start = np.argmax(mask) * hop_length
+            end = (len(mask) - np.argmax(mask[::-1])) * hop_length
+            trimmed = audio[start:min(end, len(audio))]
+
         print(f"[AudioProcessor] Trimmed from {len(audio)} to {len(trimmed)} samples")
-        
+
         return trimmed
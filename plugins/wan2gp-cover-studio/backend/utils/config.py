@@ -21,7 +21,9 @@ class Config:
         self.max_upload_size = int(os.environ.get("MAX_UPLOAD_SIZE", 100 * 1024 * 1024))
         
         self.default_sample_rate = 44100
-        self.segment_length = 30
+        # Segment duration is handed down by the plugin control plane;
+        # the hardcoded value is only the standalone default
+        self.segment_length = int(os.environ.get("COVERSTUDIO_SEGMENT_LENGTH", 30))
         self.hop_length = 512
         self.n_fft = 2048
         
@@ -1,6 +1,27 @@
 import React, { useRef, useEffect } from 'react';
 import useWavesurfer from '../hooks/useWavesurfer';
 
+// The backend sends peaks as base64 float16 [max, min] pairs; decode
+// them by hand since Float16Array isn't available everywhere yet
+const halfToFloat = (h) => {
+  const sign = h & 0x8000 ? -1 : 1;
+  const exp = (h >> 10) & 0x1f;
+  const frac = h & 0x3ff;
+  if (exp === 0) return sign * frac * 2 ** -24;
+  if (exp === 31) return frac ? NaN : sign * Infinity;
+  return sign * (1 + frac / 1024) * 2 ** (exp - 15);
+};
+
+const decodePeaks = (b64) => {
+  const bytes = Uint8Array.from(atob(b64), (c) => c.charCodeAt(0));
+  const halves = new Uint16Array(bytes.buffer, bytes.byteOffset, bytes.byteLength / 2);
+  const peaks = new Float32Array(halves.length);
+  for (let i = 0; i < halves.length; i++) {
+    peaks[i] = halfToFloat(halves[i]);
+  }
+  return peaks;
+};
+
 const WaveformPlayer = ({ audioUrl, waveformData }) => {
   const containerRef = useRef(null);
   const { isReady, isPlaying, currentTime, duration, play, pause, loadAudio, loadPeaks } = useWavesurfer(containerRef);
@@ -9,7 +30,10 @@ const WaveformPlayer = ({ audioUrl, waveformData }) => {
     if (audioUrl) {
       loadAudio(audioUrl);
     } else if (waveformData) {
-      loadPeaks([waveformData.samples], waveformData.duration);
+      const peaks = waveformData.peaks_b64
+        ? decodePeaks(waveformData.peaks_b64)
+        : waveformData.samples;
+      loadPeaks([peaks], waveformData.duration);
     }
   }, [audioUrl, waveformData]);
 
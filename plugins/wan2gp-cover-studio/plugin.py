@@ -2,9 +2,9 @@ import gradio as gr
 from shared.utils.plugins import WAN2GPPlugin
 from shared.utils.process_locks import acquire_GPU_ressources, release_GPU_ressources, any_GPU_process_running
 import os
+import socket
 import subprocess
 import sys
-import signal
 import time
 import json
 
@@ -17,6 +17,16 @@ class CoverStudioPlugin(WAN2GPPlugin):
         self.server_process = None
         self.server_port = 8765
         self.plugin_dir = os.path.dirname(os.path.abspath(__file__))
+        self.log_path = os.path.join(self.plugin_dir, "server.log")
+        # Derive every launch path once; start_server only reads them
+        self._backend_dir = os.path.join(self.plugin_dir, "backend")
+        self._server_script = os.path.join(self._backend_dir, "server.py")
+        self._pythonpath_root = os.path.dirname(
+            os.path.dirname(os.path.dirname(self.plugin_dir))
+        )
+        self._base_env = {**os.environ, "PYTHONPATH": self._pythonpath_root}
+        self._status_cache = (0.0, "")
+        self._lifeline_w = None
 
     def setup_ui(self):
         self.request_component("state")
@@ -28,63 +38,134 @@ class CoverStudioPlugin(WAN2GPPlugin):
             component_constructor=self.create_ui,
         )
 
-    def start_server(self):
+    def start_server(self, segment_length=30, audio_pool_mb=512):
         if self.server_process and self.server_process.poll() is None:
             return "Server is already running"
         
         try:
-            backend_dir = os.path.join(self.plugin_dir, "backend")
-            server_script = os.path.join(backend_dir, "server.py")
-            
-            if not os.path.exists(server_script):
-                return f"Error: Server script not found at {server_script}"
-            
-            env = os.environ.copy()
-            env["PYTHONPATH"] = os.path.dirname(os.path.dirname(os.path.dirname(self.plugin_dir)))
-            
-            self.server_process = subprocess.Popen(
-                [sys.executable, server_script],
-                cwd=backend_dir,
-                env=env,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                start_new_session=True
-            )
+            if not os.path.exists(self._server_script):
+                return f"Error: Server script not found at {self._server_script}"
+
+            env = dict(self._base_env)
+            # The plugin is the control plane for the backend's
+            # segment-by-segment pipeline: segment duration is handed
+            # off through the environment and becomes the backend's
+            # default for /process requests that don't specify one
+            env["COVERSTUDIO_SEGMENT_LENGTH"] = str(int(segment_length))
+            env["COVERSTUDIO_AUDIO_POOL_MB"] = str(int(audio_pool_mb))
             
-            time.sleep(2)
+            # Lifeline pipe (POSIX only): the child watches the read
+            # end and exits itself on EOF, so it can never outlive the
+            # parent no matter how the parent dies — no signals or
+            # process groups. Windows can't hand a CRT fd number across
+            # Popen (handles are inherited, fd numbers are not), so
+            # stop_server uses terminate() there instead
+            if self._lifeline_w is not None:
+                try:
+                    os.close(self._lifeline_w)
+                except OSError:
+                    pass
+                self._lifeline_w = None
+            lifeline_r = lifeline_w = None
+            inherit_kwargs = {}
+            if sys.platform != "win32":
+                lifeline_r, lifeline_w = os.pipe()
+                os.set_inheritable(lifeline_r, True)
+                env["COVERSTUDIO_PARENT_FD"] = str(lifeline_r)
+                inherit_kwargs = {"pass_fds": (lifeline_r,)}
+
+            # Write straight to a log file: an unread PIPE fills its
+            # 64 KB buffer and wedges the child under sustained output,
+            # and the kernel-side fd needs no Python reader thread
+            log_file = open(self.log_path, "ab", buffering=0)
+            try:
+                self.server_process = subprocess.Popen(
+                    [sys.executable, self._server_script],
+                    cwd=self._backend_dir,
+                    env=env,
+                    stdout=log_file,
+                    stderr=log_file,
+                    **inherit_kwargs
+                )
+            finally:
+                log_file.close()
+                if lifeline_r is not None:
+                    os.close(lifeline_r)
+            self._lifeline_w = lifeline_w
             
+            # Poll for readiness instead of sleeping a fixed 2 s: return
+            # as soon as the backend's socket accepts, bail out early if
+            # the process died, worst case matches the old 2 s wait
+            deadline = time.monotonic() + 2.0
+            while time.monotonic() < deadline:
+                if self.server_process.poll() is not None:
+                    return f"Error: Server failed to start\n{self._read_log_tail()}"
+                try:
+                    socket.create_connection(
+                        ("127.0.0.1", self.server_port), timeout=0.05
+                    ).close()
+                    return f"✓ Server started successfully on port {self.server_port}"
+                except OSError:
+                    time.sleep(0.025)
+
             if self.server_process.poll() is None:
-                return f"✓ Server started successfully on port {self.server_port}"
+                return f"✓ Server started on port {self.server_port} (still initializing)"
             else:
-                stdout, stderr = self.server_process.communicate()
-                return f"Error: Server failed to start\nStdout: {stdout.decode()}\nStderr: {stderr.decode()}"
+                return f"Error: Server failed to start\n{self._read_log_tail()}"
         except Exception as e:
             return f"Error starting server: {str(e)}"
+        finally:
+            self._status_cache = (0.0, "")
+
+    def _read_log_tail(self, max_bytes=4096):
+        try:
+            with open(self.log_path, "rb") as log_file:
+                log_file.seek(0, os.SEEK_END)
+                log_file.seek(max(0, log_file.tell() - max_bytes))
+                return log_file.read().decode(errors="replace")
+        except OSError:
+            return "(no server log available)"
 
     def stop_server(self):
         if not self.server_process or self.server_process.poll() is not None:
             return "Server is not running"
         
         try:
-            if sys.platform == "win32":
-                self.server_process.terminate()
+            # Closing the write end EOFs the child's lifeline and it
+            # exits on its own; kill() is only the unresponsive fallback.
+            # Without a lifeline (Windows) ask via the process handle
+            if self._lifeline_w is not None:
+                os.close(self._lifeline_w)
+                self._lifeline_w = None
             else:
-                os.killpg(os.getpgid(self.server_process.pid), signal.SIGTERM)
-            
-            time.sleep(1)
-            
-            if self.server_process.poll() is None:
+                self.server_process.terminate()
+
+            try:
+                self.server_process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
                 self.server_process.kill()
-            
+                self.server_process.wait(timeout=2)
+
             return "✓ Server stopped successfully"
         except Exception as e:
             return f"Error stopping server: {str(e)}"
+        finally:
+            self._status_cache = (0.0, "")
 
     def get_server_status(self):
+        # Bursts of refreshes (initial value + the .then() chains +
+        # manual clicks across sessions) share one poll() syscall;
+        # server state only changes on human timescales
+        now = time.monotonic()
+        if now - self._status_cache[0] < 0.25:
+            return self._status_cache[1]
+
         if self.server_process and self.server_process.poll() is None:
-            return f"🟢 Running on port {self.server_port}"
+            status = f"🟢 Running on port {self.server_port}"
         else:
-            return "🔴 Stopped"
+            status = "🔴 Stopped"
+        self._status_cache = (now, status)
+        return status
 
     def create_ui(self):
         with gr.Column():
@@ -175,31 +256,61 @@ class CoverStudioPlugin(WAN2GPPlugin):
                 
                 Models should be placed in: `plugins/wan2gp-cover-studio/models/`
                 """)
+
+                segment_length_slider = gr.Slider(
+                    minimum=5,
+                    maximum=60,
+                    value=30,
+                    step=5,
+                    label="Segment Length (seconds)",
+                    info="Duration of each processing segment; applied on server start"
+                )
+
+                audio_pool_mb_number = gr.Number(
+                    value=512,
+                    precision=0,
+                    label="Audio Buffer Pool (MB)",
+                    info="Memory the backend keeps for decoded audio buffers; applied on server start"
+                )
             
+            # Start/stop share one single-writer queue slot so the
+            # server process is never mutated concurrently, while the
+            # read-only status refresh fans out on its own slot and is
+            # never stuck behind a slow start
             start_btn.click(
                 fn=self.start_server,
-                inputs=[],
-                outputs=[server_output]
+                inputs=[segment_length_slider, audio_pool_mb_number],
+                outputs=[server_output],
+                concurrency_limit=1,
+                concurrency_id="coverstudio_mutate"
             ).then(
                 fn=self.get_server_status,
                 inputs=[],
-                outputs=[status_text]
+                outputs=[status_text],
+                concurrency_limit=16,
+                concurrency_id="coverstudio_status"
             )
-            
+
             stop_btn.click(
                 fn=self.stop_server,
                 inputs=[],
-                outputs=[server_output]
+                outputs=[server_output],
+                concurrency_limit=1,
+                concurrency_id="coverstudio_mutate"
             ).then(
                 fn=self.get_server_status,
                 inputs=[],
-                outputs=[status_text]
+                outputs=[status_text],
+                concurrency_limit=16,
+                concurrency_id="coverstudio_status"
             )
-            
+
             refresh_status_btn.click(
                 fn=self.get_server_status,
                 inputs=[],
-                outputs=[status_text]
+                outputs=[status_text],
+                concurrency_limit=16,
+                concurrency_id="coverstudio_status"
             )
 
     def on_tab_select(self, state: dict) -> None:
@@ -209,8 +320,10 @@ class CoverStudioPlugin(WAN2GPPlugin):
         pass
 
     def __del__(self):
-        if self.server_process and self.server_process.poll() is None:
+        # Just drop the lifeline; the child notices EOF and exits, and
+        # a plain close is safe even during interpreter shutdown
+        if getattr(self, "_lifeline_w", None) is not None:
             try:
-                self.stop_server()
-            except:
+                os.close(self._lifeline_w)
+            except OSError:
                 pass
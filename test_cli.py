@@ -1,75 +1,128 @@
 #!/usr/bin/env python3
-"""Simple CLI test for wgp without Gradio"""
+"""Simple CLI test for wgp without Gradio
+
+Run all tests, or pass a subset of test names (import, gpu, config) to
+skip the ones you don't need — `python test_cli.py gpu` checks the cudnn
+flags without paying for the multi-second wgp/diffusers import.
+
+The tests are independent, so they run on a small thread pool: CUDA
+context creation and the wgp import both spend most of their time in
+GIL-releasing C calls and overlap nicely. Output is printed in test
+order regardless of which finishes first.
+"""
 
 import sys
 import os
-import subprocess
-
-# Set working directory
-os.chdir(os.path.dirname(__file__))
-
-print("=" * 70)
-print("WGP CLI Testing (Without Gradio)")
-print("=" * 70)
-
-# Test 1: Initialize module
-print("\n[TEST 1] Basic module import...")
-try:
-    import wgp
-    print("✓ Module imported successfully")
-except Exception as e:
-    print(f"✗ Import failed: {e}")
-    sys.exit(1)
-
-# Test 2: Check RTX 3070 optimizations
-print("\n[TEST 2] Checking RTX 3070 optimizations...")
-try:
-    import torch
-    
-    # Check cudnn settings
-    print(f"  • cudnn.benchmark: {torch.backends.cudnn.benchmark}")
-    print(f"  • cudnn.enabled: {torch.backends.cudnn.enabled}")
-    print(f"  • cuda.matmul.allow_tf32: {torch.backends.cuda.matmul.allow_tf32}")
-    
-    # Check GPU
-    if torch.cuda.is_available():
-        gpu_name = torch.cuda.get_device_name(0)
-        gpu_cap = torch.cuda.get_device_capability(0)
-        print(f"  • GPU detected: {gpu_name} (Capability: {gpu_cap[0]}.{gpu_cap[1]})")
-        
-        # Check if RTX 3070 detected
-        if "3070" in gpu_name.lower():
-            print(f"  ✓ RTX 3070 detected - automatic optimizations applied!")
+from concurrent.futures import ThreadPoolExecutor
+
+ALL_TESTS = ("import", "gpu", "config")
+
+
+def test_import():
+    lines = ["\n[TEST 1] Basic module import..."]
+    try:
+        import wgp  # noqa: F401
+        lines.append("✓ Module imported successfully")
+    except Exception as e:
+        lines.append(f"✗ Import failed: {e}")
+    return lines
+
+
+def test_gpu():
+    lines = ["\n[TEST 2] Checking RTX 3070 optimizations..."]
+    try:
+        import torch
+
+        # Check cudnn settings
+        lines.append(f"  • cudnn.benchmark: {torch.backends.cudnn.benchmark}")
+        lines.append(f"  • cudnn.enabled: {torch.backends.cudnn.enabled}")
+        lines.append(f"  • cuda.matmul.allow_tf32: {torch.backends.cuda.matmul.allow_tf32}")
+
+        # Check GPU
+        if torch.cuda.is_available():
+            gpu_name = torch.cuda.get_device_name(0)
+            gpu_cap = torch.cuda.get_device_capability(0)
+            lines.append(f"  • GPU detected: {gpu_name} (Capability: {gpu_cap[0]}.{gpu_cap[1]})")
+
+            # Check if RTX 3070 detected
+            if "3070" in gpu_name.lower():
+                lines.append(f"  ✓ RTX 3070 detected - automatic optimizations applied!")
+            else:
+                lines.append(f"  ⓘ GPU: {gpu_name} (auto-optimizations for 3070 available)")
         else:
-            print(f"  ⓘ GPU: {gpu_name} (auto-optimizations for 3070 available)")
-    else:
-        print(f"  ⓘ No GPU detected (CPU mode)")
-    
-    if hasattr(wgp, 'bfloat16_supported'):
-        print(f"  • bf16 supported: {wgp.bfloat16_supported}")
-        
-except Exception as e:
-    print(f"✗ Error: {e}")
-
-# Test 3: Check args/config  
-print("\n[TEST 3] Checking CLI args and server config...")
-try:
-    if hasattr(wgp, 'args'):
-        args = wgp.args
-        print(f"  • args.gpu: {getattr(args, 'gpu', 'Not set')}")
-        print(f"  • args.vram_safety_coefficient: {getattr(args, 'vram_safety_coefficient', 'Not set')}")
-        print(f"  • args.fp16: {getattr(args, 'fp16', False)}")
-        
-    if hasattr(wgp, 'server_config'):
-        config = wgp.server_config
-        print(f"  • mixed_precision: {config.get('mixed_precision', 'Not set')}")
-        print(f"  • transformer_quantization: {getattr(wgp, 'transformer_quantization', 'Not set')}")
-        print(f"  • transformer_dtype_policy: {getattr(wgp, 'transformer_dtype_policy', 'Not set')}")
-        
-    print("✓ Config initialized successfully")
-except Exception as e:
-    print(f"✗ Error: {e}")
-
-print("\n" + "=" * 70)
-print("CLI Test Complete - All verifications passed!")
-print("=" * 70)
+            lines.append(f"  ⓘ No GPU detected (CPU mode)")
+
+        # Only report wgp's flag if the import test already loaded it
+        wgp = sys.modules.get("wgp")
+        if wgp is not None and 'bfloat16_supported' in vars(wgp):
+            lines.append(f"  • bf16 supported: {wgp.bfloat16_supported}")
+
+    except Exception as e:
+        lines.append(f"✗ Error: {e}")
+    return lines
+
+
+def test_config():
+    lines = ["\n[TEST 3] Checking CLI args and server config..."]
+    try:
+        import wgp
+
+        # One vars() snapshot of the module and args instead of a
+        # hasattr/getattr (and its exception machinery) per attribute
+        mod = vars(wgp)
+        if 'args' in mod:
+            args_d = vars(mod['args'])
+            lines.append(f"  • args.gpu: {args_d.get('gpu', 'Not set')}")
+            lines.append(f"  • args.vram_safety_coefficient: {args_d.get('vram_safety_coefficient', 'Not set')}")
+            lines.append(f"  • args.fp16: {args_d.get('fp16', False)}")
+
+        if 'server_config' in mod:
+            config = mod['server_config']
+            lines.append(f"  • mixed_precision: {config.get('mixed_precision', 'Not set')}")
+            lines.append(f"  • transformer_quantization: {mod.get('transformer_quantization', 'Not set')}")
+            lines.append(f"  • transformer_dtype_policy: {mod.get('transformer_dtype_policy', 'Not set')}")
+
+        lines.append("✓ Config initialized successfully")
+    except Exception as e:
+        lines.append(f"✗ Error: {e}")
+    return lines
+
+
+TESTS = {
+    "import": test_import,
+    "gpu": test_gpu,
+    "config": test_config,
+}
+
+
+def main():
+    # Set working directory
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    requested = [t for t in sys.argv[1:] if t in ALL_TESTS] or list(ALL_TESTS)
+    # wgp parses sys.argv at import time with a flags-only parser; strip
+    # the consumed test names so they don't blow up that parse
+    sys.argv = sys.argv[:1]
+
+    print("=" * 70)
+    print("WGP CLI Testing (Without Gradio)")
+    print("=" * 70)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(TESTS[name])
+            for name in ALL_TESTS if name in requested
+        ]
+        for future in futures:
+            lines = future.result()
+            print("\n".join(lines))
+            if any(line.startswith("✗ Import failed") for line in lines):
+                sys.exit(1)
+
+    print("\n" + "=" * 70)
+    print("CLI Test Complete - All verifications passed!")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()